@@ -2,15 +2,42 @@
 FastAPI routes for product API endpoints.
 """
 
-from typing import List, Optional
-from fastapi import FastAPI, HTTPException, Query
+import hashlib
+import os
+from email.utils import formatdate
+from typing import Any, Dict, List, Optional, Tuple
+import orjson
+from fastapi import FastAPI, Header, HTTPException, Query, Response
 from fastapi.responses import JSONResponse
+from pydantic import ValidationError
 from models.product import Product, ProductResponse
-from utils.helpers import load_products
+from utils.helpers import load_products, normalize_product
 from utils.logger import get_logger
+from utils.storage import ProductStore
 
 logger = get_logger(__name__)
 
+PRODUCTS_FILE = "products.json"
+PRODUCTS_JSONL = "products.jsonl"
+PRODUCTS_DB = "products.db"
+
+# Storage backend: "json" (PRODUCTS_FILE), "jsonl" (PRODUCTS_JSONL) or
+# "sqlite" (PRODUCTS_DB)
+STORAGE_BACKEND = os.environ.get("PRODUCT_STORAGE", "json")
+
+# Cache-Control policies: the product data only changes when the scraper
+# runs, the root document only changes with a new release
+CACHE_CONTROL_PRODUCTS = "public, max-age=60"
+CACHE_CONTROL_ROOT = "public, max-age=86400, immutable"
+CACHE_CONTROL_HEALTH = "no-store"
+
+# Validated products keyed on the storage version (see _storage_version),
+# along with each product's JSON encoding so responses skip serialization
+_cache: Dict[str, Any] = {}
+
+_store = ProductStore(PRODUCTS_DB) if STORAGE_BACKEND == "sqlite" else None
+_products_file = PRODUCTS_JSONL if STORAGE_BACKEND == "jsonl" else PRODUCTS_FILE
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Product Scraper API",
@@ -21,14 +48,177 @@ app = FastAPI(
 )
 
 
+def _storage_version() -> Optional[Tuple[Tuple[int, int], float]]:
+    """
+    Cheaply identify the current version of the stored products.
+
+    For the JSON files this is their (st_mtime_ns, st_size); for SQLite it is
+    the last write time recorded by ProductStore.
+
+    Returns:
+        Tuple of (cache key, modification time in seconds), or None if
+        nothing has been stored yet
+    """
+    if _store is not None:
+        updated_ns = _store.version()
+        if updated_ns is None:
+            return None
+        return (updated_ns, 0), updated_ns / 1e9
+
+    try:
+        stat = os.stat(_products_file)
+    except FileNotFoundError:
+        return None
+
+    return (stat.st_mtime_ns, stat.st_size), stat.st_mtime
+
+
+def get_products_cached() -> Tuple[List[Product], Dict[int, Product]]:
+    """
+    Get validated products, re-reading storage only when it changes.
+
+    The storage version is checked on every call; products are loaded and
+    validated again only when it differs from the cached copy, so a scraper
+    run that saves new data invalidates the cache automatically.
+
+    Each stored row goes through the same normalization as freshly scraped
+    products first, so files written by older versions (e.g. string prices)
+    are migrated on read. Rows that still don't match the Product model are
+    logged and skipped rather than failing the whole load. Read errors, of
+    the JSON files and the SQLite database alike, propagate and are not
+    cached, so the next call reads again.
+
+    Returns:
+        Tuple of (products in storage order, products indexed by ID)
+
+    Raises:
+        OSError, orjson.JSONDecodeError: If the products file can't be read
+        sqlite3.Error: If the SQLite database can't be read
+    """
+    version = _storage_version()
+    if version is None:
+        _cache.clear()
+        return [], {}
+
+    key, mtime = version
+
+    if _cache.get("key") != key:
+        source = PRODUCTS_DB if _store is not None else _products_file
+        # Read before touching the cache: a failed read (e.g. a locked
+        # database or an unreadable file) propagates and the next request simply tries again
+        data = (
+            _store.get_products() if _store is not None
+            else load_products(_products_file, strict=True)
+        )
+
+        _cache.clear()
+        _cache["key"] = key
+
+        products = []
+        for row in data:
+            try:
+                products.append(Product.model_validate(normalize_product(row)))
+            except (AttributeError, KeyError, TypeError, ValueError, ValidationError) as e:
+                product_id = row.get("id") if isinstance(row, dict) else None
+                logger.warning("[ID:%s] Skipping invalid product in %s: %s", product_id, source, e)
+
+        # Responses are rendered from per-ID encodings, so keep one product
+        # per ID: the last one, in the first one's position (like merge_products)
+        by_id = {p.id: p for p in products}
+        if len(by_id) != len(products):
+            logger.warning("Dropped %d duplicate product IDs in %s", len(products) - len(by_id), source)
+            products = list(by_id.values())
+
+        _cache.update(
+            mtime=mtime,
+            products=products,
+            by_id=by_id,
+            encoded={p.id: orjson.dumps(p.model_dump()) for p in products}
+        )
+        # Body of the unfiltered listing, the most common request
+        _cache["full_body"] = _render_products(len(products), products)
+        logger.info("Product cache reloaded: %d products", len(products))
+
+    return _cache["products"], _cache["by_id"]
+
+
+def _cache_headers(variant: str) -> Dict[str, str]:
+    """
+    Build validator headers for the currently cached products.
+
+    The ETag is derived from the cache key (the storage version) plus the
+    request variant, so it never requires hashing the response body.
+
+    Args:
+        variant: String identifying the requested representation
+
+    Returns:
+        Dict with ETag, Last-Modified and Cache-Control headers
+    """
+    version, size = _cache["key"]
+    digest = hashlib.blake2b(
+        f"{version}:{size}:{variant}".encode(),
+        digest_size=8
+    ).hexdigest()
+
+    return {
+        "ETag": f'"{digest}"',
+        "Last-Modified": formatdate(_cache["mtime"], usegmt=True),
+        "Cache-Control": CACHE_CONTROL_PRODUCTS
+    }
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header value against an ETag.
+
+    Args:
+        if_none_match: Raw If-None-Match header value (may list several tags)
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's cached copy is still current
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    tags = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in tags
+
+
+def _render_products(total: int, products: List[Product]) -> bytes:
+    """
+    Build a ProductResponse JSON body from the cached product encodings.
+
+    Args:
+        total: Total number of matching products
+        products: Products included in this page
+
+    Returns:
+        Encoded JSON body
+    """
+    encoded = _cache["encoded"]
+    return b"".join((
+        b'{"total":',
+        str(total).encode(),
+        b',"products":[',
+        b",".join(encoded[p.id] for p in products),
+        b"]}"
+    ))
+
+
 @app.get("/", tags=["Root"])
-async def root():
+async def root(response: Response):
     """
     Root endpoint with API information.
 
     Returns:
         API welcome message and available endpoints
     """
+    response.headers["Cache-Control"] = CACHE_CONTROL_ROOT
     return {
         "message": "Product Scraper API",
         "version": "1.0.0",
@@ -42,13 +232,14 @@ async def root():
 
 
 @app.get("/health", tags=["Health"])
-async def health_check():
+async def health_check(response: Response):
     """
     Health check endpoint.
 
     Returns:
         API health status
     """
+    response.headers["Cache-Control"] = CACHE_CONTROL_HEALTH
     return {"status": "healthy", "service": "product-scraper-api"}
 
 
@@ -69,7 +260,8 @@ async def get_products(
         0,
         description="Number of products to skip",
         ge=0
-    )
+    ),
+    if_none_match: Optional[str] = Header(None)
 ):
     """
     Get all products or filter by IDs.
@@ -79,12 +271,16 @@ async def get_products(
         - limit: Maximum number of products to return (optional)
         - offset: Number of products to skip for pagination (optional)
 
+    Headers:
+        - If-None-Match: ETag from a previous response (optional)
+
     Returns:
-        ProductResponse with total count and list of products
+        ProductResponse with total count and list of products, or an empty
+        304 response if the client's ETag is still current
 
     Examples:
         - GET /products → Returns all products
-        - GET /products?ids=1,2,3 → Returns products with IDs 1, 2, and 3
+        - GET /products?ids=1,2,3 → Returns products with IDs 1, 2, and 3 (in that order)
         - GET /products?limit=10&offset=0 → Returns first 10 products
         - GET /products?ids=1,5,10&limit=2 → Returns max 2 products from IDs 1,5,10
 
@@ -92,28 +288,48 @@ async def get_products(
         HTTPException: 404 if no products found, 500 if data loading fails
     """
     try:
-        # Load products from file
-        products_data = load_products("products.json")
+        products, products_by_id = get_products_cached()
 
-        if not products_data:
+        if not products:
             raise HTTPException(
                 status_code=404,
                 detail="No products found. Run the scraper first to populate data."
             )
 
+        headers = _cache_headers(f"list:{ids}:{limit}:{offset}")
+
+        if _etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+        # Unfiltered listing: serve the body rendered when the cache loaded
+        if not ids and limit is None and offset == 0:
+            logger.info("Returning all %d products", len(products))
+            return Response(
+                content=_cache["full_body"],
+                media_type="application/json",
+                headers=headers
+            )
+
         # Filter by IDs if provided
         if ids:
             try:
-                id_list = [int(id_str.strip()) for id_str in ids.split(",")]
-                products_data = [p for p in products_data if p.get("id") in id_list]
-
-                if not products_data:
+                # Deduplicate while keeping the requested order
+                id_list = list(dict.fromkeys(
+                    int(id_str.strip()) for id_str in ids.split(",")
+                ))
+                products = [
+                    products_by_id[product_id]
+                    for product_id in id_list
+                    if product_id in products_by_id
+                ]
+
+                if not products:
                     raise HTTPException(
                         status_code=404,
                         detail=f"No products found with IDs: {ids}"
                     )
 
-                logger.info(f"Filtered products by IDs: {id_list}")
+                logger.info("Filtered products by IDs: %s", id_list)
             except ValueError:
                 raise HTTPException(
                     status_code=400,
@@ -121,35 +337,26 @@ async def get_products(
                 )
 
         # Apply pagination
-        total = len(products_data)
+        total = len(products)
 
         if offset >= total:
-            products_data = []
+            products = []
         else:
             end_index = offset + limit if limit else total
-            products_data = products_data[offset:end_index]
+            products = products[offset:end_index]
 
-        # Validate and convert to Product models
-        try:
-            products = [Product(**p) for p in products_data]
-        except Exception as e:
-            logger.error(f"Error validating product data: {e}")
-            raise HTTPException(
-                status_code=500,
-                detail="Invalid product data format in storage"
-            )
+        logger.info("Returning %d products (total: %d)", len(products), total)
 
-        logger.info(f"Returning {len(products)} products (total: {total})")
-
-        return ProductResponse(
-            total=total,
-            products=products
+        return Response(
+            content=_render_products(total, products),
+            media_type="application/json",
+            headers=headers
         )
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving products: {e}")
+        logger.error("Error retrieving products: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Internal server error: {str(e)}"
@@ -157,15 +364,22 @@ async def get_products(
 
 
 @app.get("/products/{product_id}", response_model=Product, tags=["Products"])
-async def get_product_by_id(product_id: int):
+async def get_product_by_id(
+    product_id: int,
+    if_none_match: Optional[str] = Header(None)
+):
     """
     Get a specific product by ID.
 
     Path Parameters:
         product_id: The unique product identifier
 
+    Headers:
+        - If-None-Match: ETag from a previous response (optional)
+
     Returns:
-        Product model with all product details
+        Product model with all product details, or an empty 304 response
+        if the client's ETag is still current
 
     Example:
         GET /products/1 → Returns product with ID 1
@@ -174,42 +388,38 @@ async def get_product_by_id(product_id: int):
         HTTPException: 404 if product not found
     """
     try:
-        products_data = load_products("products.json")
+        products, products_by_id = get_products_cached()
 
-        if not products_data:
+        if not products:
             raise HTTPException(
                 status_code=404,
                 detail="No products found. Run the scraper first to populate data."
             )
 
-        # Find product by ID
-        product_data = next(
-            (p for p in products_data if p.get("id") == product_id),
-            None
-        )
+        product = products_by_id.get(product_id)
 
-        if not product_data:
+        if not product:
             raise HTTPException(
                 status_code=404,
                 detail=f"Product with ID {product_id} not found"
             )
 
-        # Validate and return product
-        try:
-            product = Product(**product_data)
-            logger.info(f"Retrieved product ID {product_id}: {product.name}")
-            return product
-        except Exception as e:
-            logger.error(f"Error validating product {product_id}: {e}")
-            raise HTTPException(
-                status_code=500,
-                detail="Invalid product data format"
-            )
+        headers = _cache_headers(f"product:{product_id}")
+
+        if _etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+        logger.info("Retrieved product ID %s: %s", product_id, product.name)
+        return Response(
+            content=_cache["encoded"][product_id],
+            media_type="application/json",
+            headers=headers
+        )
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving product {product_id}: {e}")
+        logger.error("Error retrieving product %s: %s", product_id, e)
         raise HTTPException(
             status_code=500,
             detail=f"Internal server error: {str(e)}"
@@ -232,7 +442,7 @@ async def not_found_handler(request, exc):
 @app.exception_handler(500)
 async def internal_error_handler(request, exc):
     """Custom 500 error handler."""
-    logger.error(f"Internal server error: {exc}")
+    logger.error("Internal server error: %s", exc)
     return JSONResponse(
         status_code=500,
         content={
@@ -7,31 +7,75 @@ This module provides CLI commands to:
 3. Run both scraper and server together
 
 Usage:
-    python main.py scrape [--max-products N] [--concurrent N]
-    python main.py serve [--host HOST] [--port PORT]
+    python main.py scrape [--max-products N] [--concurrent N] [--per-domain N] [--revalidate]
+                          [--storage json|jsonl|sqlite]
+    python main.py serve [--host HOST] [--port PORT] [--workers N] [--storage json|jsonl|sqlite]
     python main.py run [--max-products N]
 """
 
 import asyncio
 import argparse
+import os
 import sys
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
 
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+from models.product import ScrapedProduct
+from scraper.browser import BrowserManager
 from scraper.core import ScraperEngine
 from scraper.examples import ExampleMercadoLibreScraper, ExampleOLXScraper
-from utils.helpers import save_products, load_products, merge_products
+from utils.helpers import (
+    asave_products, save_products_append, load_products, merge_products, normalize_product
+)
 from utils.logger import get_logger
+from utils.storage import ProductStore
 
 logger = get_logger(__name__)
 
+def _normalize_all(
+    products: List[Union[ScrapedProduct, Dict[str, Any]]],
+    keep_invalid: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Normalize products, skipping the ones with unparseable fields.
+
+    Scraped products are converted to dicts here, where they are stored.
+
+    Args:
+        products: Products as scraped or product dictionaries as loaded
+        keep_invalid: Keep products that fail to normalize unchanged instead
+            of skipping them; used for stored products, which would
+            otherwise be dropped from the file when it's rewritten
+            (default: False)
+
+    Returns:
+        Normalized product dictionaries
+    """
+    normalized = []
+    for product in products:
+        if isinstance(product, ScrapedProduct):
+            product = product.to_dict()
+        try:
+            normalized.append(normalize_product(product))
+        except (KeyError, TypeError, ValueError) as e:
+            if keep_invalid:
+                logger.warning("[ID:%s] Keeping product as stored: %s", product.get("id"), e)
+                normalized.append(product)
+            else:
+                logger.warning("[ID:%s] Skipping product: %s", product.get("id"), e)
+    return normalized
+
 
 async def run_scraper(
     max_products: int = 10,
     max_concurrent: int = 10,
-    scraper_type: str = "mercadolibre"
+    scraper_type: str = "mercadolibre",
+    max_concurrent_per_domain: Optional[int] = None,
+    revalidate: bool = False,
+    storage: str = "json"
 ) -> bool:
     """
     Run the scraper to collect product data.
@@ -40,6 +84,12 @@ async def run_scraper(
         max_products: Maximum number of products to scrape
         max_concurrent: Maximum concurrent scraping tasks
         scraper_type: Type of scraper to use ('mercadolibre' or 'olx')
+        max_concurrent_per_domain: Maximum concurrent tasks against one host
+            (default: same as max_concurrent)
+        revalidate: Reuse data of pages the origin reports unchanged since
+            the last run, using validators stored in revalidation.json
+        storage: Where to save products: 'json' (products.json),
+            'jsonl' (products.jsonl) or 'sqlite' (products.db)
 
     Returns:
         True if successful, False otherwise
@@ -49,13 +99,6 @@ async def run_scraper(
     logger.info("=" * 60)
 
     try:
-        # Initialize scraper engine
-        engine = ScraperEngine(
-            max_concurrent=max_concurrent,
-            headless=True,
-            timeout=30000
-        )
-
         # Select scraper implementation
         if scraper_type.lower() == "olx":
             scraper = ExampleOLXScraper(
@@ -68,41 +111,61 @@ async def run_scraper(
                 max_products=max_products
             )
 
-        logger.info(f"Using scraper: {scraper.__class__.__name__}")
-
-        # Run scraper
-        products = await engine.scrape_all(scraper)
+        logger.info("Using scraper: %s", scraper.__class__.__name__)
+
+        # Run scraper in the browser context shared by all runs of this scraper
+        try:
+            async with ScraperEngine(
+                max_concurrent=max_concurrent,
+                headless=True,
+                timeout=30000,
+                max_concurrent_per_domain=max_concurrent_per_domain,
+                revalidation_cache_path="revalidation.json" if revalidate else None,
+                storage_state_path=scraper.storage_state_path,
+                context_name=type(scraper).__name__
+            ) as engine:
+                products = await engine.scrape_all(scraper)
+        finally:
+            await BrowserManager.close()
 
         if not products:
             logger.warning("No products were scraped")
             return False
 
-        # Convert to dict format for saving
-        products_data = [
-            {
-                "id": p["id"],
-                "name": p["name"],
-                "image_url": p["image_url"],
-                "description": p["description"],
-                "price": p["price"],
-                "rating": p.get("rating"),
-                "specifications": p.get("specifications", {}),
-                "source_url": p.get("source_url")
+        # Convert to the stored format
+        products_data = _normalize_all(products)
+
+        if storage == "sqlite":
+            # Only the scraped rows are written; existing ones stay in place
+            store = ProductStore("products.db")
+            try:
+                success = store.upsert_products(products_data)
+                total_products = store.count()
+            finally:
+                store.close()
+        elif storage == "jsonl":
+            # Append only new or changed products; the loader keeps the last line per ID
+            existing = {
+                p.get("id"): p
+                for p in _normalize_all(load_products("products.jsonl"), keep_invalid=True)
             }
-            for p in products
-        ]
+            changed = [p for p in products_data if existing.get(p["id"]) != p]
 
-        # Load existing products and merge
-        existing_products = load_products("products.json")
-        merged_products = merge_products(existing_products, products_data)
+            success = save_products_append(changed, "products.jsonl")
+            total_products = len(existing.keys() | {p["id"] for p in changed})
+        else:
+            # Load existing products and merge
+            existing_products = _normalize_all(load_products("products.json"), keep_invalid=True)
+            merged_products = merge_products(existing_products, products_data)
 
-        # Save to file
-        success = save_products(merged_products, "products.json")
+            # Save to file
+            success = await asave_products(merged_products, "products.json")
+            total_products = len(merged_products)
 
         if success:
             logger.info("=" * 60)
-            logger.info(f"Successfully scraped and saved {len(products)} products")
-            logger.info(f"Total products in database: {len(merged_products)}")
+            logger.info("Successfully scraped and saved %d products", len(products))
+            logger.info("Total products in database: %d", total_products)
             logger.info("=" * 60)
             return True
         else:
@@ -110,33 +173,58 @@ async def run_scraper(
             return False
 
     except Exception as e:
-        logger.error(f"Error running scraper: {e}", exc_info=True)
+        logger.error("Error running scraper: %s", e, exc_info=True)
         return False
 
 
-def run_api_server(host: str = "0.0.0.0", port: int = 8000, reload: bool = False):
+def run_api_server(
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    reload: bool = False,
+    workers: Optional[int] = None,
+    storage: str = "json"
+):
     """
     Start the FastAPI server.
 
+    Uses the uvloop event loop and httptools parser (both C implementations)
+    and disables the per-request access log.
+
     Args:
         host: Host to bind the server to
         port: Port to bind the server to
         reload: Enable auto-reload on code changes
+        workers: Number of worker processes (default: one per CPU, or a
+            single process when reload is enabled)
+        storage: Where to read products from: 'json' (products.json),
+            'jsonl' (products.jsonl) or 'sqlite' (products.db)
     """
     import uvicorn
 
+    # Read by api.routes at import time, in the reloader and worker processes too
+    os.environ["PRODUCT_STORAGE"] = storage
+    data_file = {"sqlite": "products.db", "jsonl": "products.jsonl"}.get(storage, "products.json")
+
+    if reload:
+        workers = None
+    elif workers is None:
+        workers = os.cpu_count() or 1
+
     logger.info("=" * 60)
     logger.info("Starting FastAPI Server")
     logger.info("=" * 60)
-    logger.info(f"Server will be available at: http://{host}:{port}")
-    logger.info(f"API Documentation: http://{host}:{port}/docs")
+    logger.info("Server will be available at: http://%s:%s", host, port)
+    logger.info("API Documentation: http://%s:%s/docs", host, port)
+    if workers:
+        logger.info("Worker processes: %d", workers)
     logger.info("=" * 60)
 
-    # Check if products.json exists
-    if not Path("products.json").exists():
+    # Check if the product data exists
+    if not Path(data_file).exists():
         logger.warning(
-            "products.json not found! Run 'python main.py scrape' first "
-            "to populate product data."
+            "%s not found! Run 'python main.py scrape' first "
+            "to populate product data.",
+            data_file
         )
 
     uvicorn.run(
@@ -144,6 +232,11 @@ def run_api_server(host: str = "0.0.0.0", port: int = 8000, reload: bool = False
         host=host,
         port=port,
         reload=reload,
+        workers=workers,
+        # uvloop isn't available on Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        access_log=False,
         log_level="info"
     )
 
@@ -211,6 +304,23 @@ Examples:
         default=10,
         help="Maximum concurrent scraping tasks (default: 10)"
     )
+    scrape_parser.add_argument(
+        "--per-domain",
+        type=int,
+        default=None,
+        help="Maximum concurrent tasks against a single host (default: same as --concurrent)"
+    )
+    scrape_parser.add_argument(
+        "--revalidate",
+        action="store_true",
+        help="Skip pages unchanged since the last run (conditional GET)"
+    )
+    scrape_parser.add_argument(
+        "--storage",
+        choices=["json", "jsonl", "sqlite"],
+        default="json",
+        help="Save to products.json, products.jsonl or products.db (default: json)"
+    )
     scrape_parser.add_argument(
         "--type",
         choices=["mercadolibre", "olx"],
@@ -239,6 +349,18 @@ Examples:
         action="store_true",
         help="Enable auto-reload on code changes"
     )
+    serve_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: one per CPU)"
+    )
+    serve_parser.add_argument(
+        "--storage",
+        choices=["json", "jsonl", "sqlite"],
+        default="json",
+        help="Serve products.json, products.jsonl or products.db (default: json)"
+    )
 
     # Run command (scrape + serve)
     run_parser = subparsers.add_parser(
@@ -265,14 +387,19 @@ Examples:
             asyncio.run(run_scraper(
                 max_products=args.max_products,
                 max_concurrent=args.concurrent,
-                scraper_type=args.type
+                scraper_type=args.type,
+                max_concurrent_per_domain=args.per_domain,
+                revalidate=args.revalidate,
+                storage=args.storage
             ))
 
         elif args.command == "serve":
             run_api_server(
                 host=args.host,
                 port=args.port,
-                reload=args.reload
+                reload=args.reload,
+                workers=args.workers,
+                storage=args.storage
             )
 
         elif args.command == "run":
@@ -282,7 +409,7 @@ Examples:
         print("\n\nOperation cancelled by user")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         sys.exit(1)
 
 
@@ -2,6 +2,6 @@
 Models module for product data structures.
 """
 
-from .product import Product, ProductResponse
+from .product import Product, ProductResponse, ScrapedProduct
 
-__all__ = ["Product", "ProductResponse"]
+__all__ = ["Product", "ProductResponse", "ScrapedProduct"]
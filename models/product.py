@@ -1,9 +1,53 @@
 """
-Pydantic models for product data.
+Models for product data: scraper output and the validated API models.
 """
 
-from typing import Dict, Any, Optional, List
-from pydantic import BaseModel, Field, HttpUrl
+from dataclasses import dataclass, field, fields
+from typing import Dict, Any, Optional, List, Union
+from pydantic import BaseModel, ConfigDict, Field
+
+
+@dataclass(slots=True)
+class ScrapedProduct:
+    """
+    Product data as returned by a scraper, before normalization.
+
+    A slotted dataclass instead of a dict: each instance carries no
+    per-key hash table, which adds up when a run holds many products in
+    memory. It is converted to a dict only where products are stored.
+
+    Attributes:
+        id: Unique identifier for the product
+        name: Product name/title
+        image_url: URL to the product image
+        description: Product description
+        price: Price as scraped, e.g. "$299.99", or a number
+        rating: Product rating
+        specifications: Flexible dict with key-value pairs for product specs
+        source_url: Original URL where the product was scraped from
+        currency: Currency code used when the price has no symbol
+    """
+
+    id: int
+    name: str
+    image_url: str
+    description: str
+    price: Union[str, float]
+    rating: Optional[float] = None
+    specifications: Dict[str, Any] = field(default_factory=dict)
+    source_url: Optional[str] = None
+    currency: str = "USD"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a plain dict.
+
+        Unlike dataclasses.asdict, values aren't deep-copied.
+
+        Returns:
+            Dictionary with one key per field
+        """
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
 
 class Product(BaseModel):
@@ -15,8 +59,9 @@ class Product(BaseModel):
         name: Product name/title
         image_url: URL to the product image
         description: Product description
-        price: Product price (can be string with currency or float)
-        rating: Product rating (float or string)
+        price: Product price as a number
+        currency: ISO 4217 currency code of the price
+        rating: Product rating
         specifications: Flexible dict with key-value pairs for product specs
         source_url: Original URL where the product was scraped from
     """
@@ -25,22 +70,25 @@ class Product(BaseModel):
     name: str = Field(..., description="Product name", min_length=1)
     image_url: str = Field(..., description="URL to product image")
     description: str = Field(..., description="Product description")
-    price: str | float = Field(..., description="Product price")
-    rating: Optional[str | float] = Field(None, description="Product rating")
+    price: float = Field(..., description="Product price")
+    currency: str = Field("USD", description="ISO 4217 currency code")
+    rating: Optional[float] = Field(None, description="Product rating")
     specifications: Dict[str, Any] = Field(
         default_factory=dict,
         description="Flexible specifications dict"
     )
     source_url: Optional[str] = Field(None, description="Original product URL")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "name": "Smartphone Samsung Galaxy A54",
                 "image_url": "https://example.com/image.jpg",
                 "description": "Smartphone with 128GB storage and 6GB RAM",
-                "price": "$299.99",
+                "price": 299.99,
+                "currency": "USD",
                 "rating": 4.5,
                 "specifications": {
                     "brand": "Samsung",
@@ -51,6 +99,7 @@ class Product(BaseModel):
                 "source_url": "https://example.com/product/123"
             }
         }
+    )
 
 
 class ProductResponse(BaseModel):
@@ -65,8 +114,8 @@ class ProductResponse(BaseModel):
     total: int = Field(..., description="Total number of products")
     products: List[Product] = Field(..., description="List of products")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "total": 2,
                 "products": [
@@ -75,7 +124,8 @@ class ProductResponse(BaseModel):
                         "name": "Product 1",
                         "image_url": "https://example.com/img1.jpg",
                         "description": "Description 1",
-                        "price": "$99.99",
+                        "price": 99.99,
+                        "currency": "USD",
                         "rating": 4.5,
                         "specifications": {"brand": "BrandA"},
                         "source_url": "https://example.com/p1"
@@ -83,3 +133,4 @@ class ProductResponse(BaseModel):
                 ]
             }
         }
+    )
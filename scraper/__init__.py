@@ -2,7 +2,9 @@
 Web scraper module with Playwright integration.
 """
 
+from .browser import BrowserManager
 from .core import ScraperEngine, ProductScraper
 from .examples import ExampleMercadoLibreScraper
+from .pool import PagePool
 
-__all__ = ["ScraperEngine", "ProductScraper", "ExampleMercadoLibreScraper"]
+__all__ = ["BrowserManager", "ScraperEngine", "ProductScraper", "ExampleMercadoLibreScraper", "PagePool"]
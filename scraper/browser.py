@@ -0,0 +1,213 @@
+"""
+Process-wide Chromium browser shared by all scraper runs.
+"""
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright, Route
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Resource types product scraping never needs; they dominate page bytes
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+# /dev/shm is often tiny in containers and makes Chromium tabs crash
+LAUNCH_ARGS = ["--disable-dev-shm-usage"]
+
+
+async def _block_heavy_resources(route: Route) -> None:
+    """Abort requests for blocked resource types and let the rest through."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserManager:
+    """
+    Launches Chromium once and hands out named browser contexts.
+
+    Starting Playwright and Chromium takes seconds, so the browser is kept
+    alive for the whole process and every engine or scraper reuses it. Each
+    name gets its own context (cookies, cache, storage), created on first
+    request and kept open until close_context or close is called.
+
+    Contexts created with a storage_state_path load cookies and local
+    storage from it and write them back when closed, so a site's session
+    survives across processes instead of logging in on every run.
+
+    Call ``await BrowserManager.close()`` once before the event loop ends.
+
+    Example:
+        >>> async with BrowserManager.context("ExampleOLXScraper") as context:
+        ...     page = await context.new_page()
+        >>> await BrowserManager.close()
+    """
+
+    _playwright: Optional[Playwright] = None
+    _browser: Optional[Browser] = None
+    _contexts: Dict[str, BrowserContext] = {}
+    _state_paths: Dict[str, str] = {}
+    _lock: Optional[asyncio.Lock] = None
+
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        """Get the lock serializing launches and context creation."""
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        return cls._lock
+
+    @classmethod
+    def is_running(cls) -> bool:
+        """Check whether the shared browser has been launched."""
+        return cls._browser is not None
+
+    @classmethod
+    async def _launch(cls, headless: bool) -> Browser:
+        """
+        Start Playwright and Chromium unless they're already running.
+
+        Must be called with the lock held.
+
+        Args:
+            headless: Run browser in headless mode; ignored if it's running
+
+        Returns:
+            Shared Browser instance
+        """
+        if cls._browser is None:
+            logger.info("Launching browser...")
+            cls._playwright = await async_playwright().start()
+            try:
+                cls._browser = await cls._playwright.chromium.launch(
+                    headless=headless,
+                    args=LAUNCH_ARGS
+                )
+            except Exception:
+                await cls._playwright.stop()
+                cls._playwright = None
+                raise
+            logger.info("Browser launched successfully")
+        return cls._browser
+
+    @classmethod
+    async def get_context(
+        cls,
+        name: str,
+        headless: bool = True,
+        block_resources: bool = True,
+        storage_state_path: Optional[str] = None,
+        **options: Any
+    ) -> BrowserContext:
+        """
+        Get the context registered under a name, creating it if needed.
+
+        Options only apply when the context is created; later calls with
+        the same name return the existing context as is.
+
+        Args:
+            name: Context name, typically the scraper class name
+            headless: Run browser in headless mode if it has to be launched
+                (default: True)
+            block_resources: Abort image, media, font and stylesheet
+                requests in the new context (default: True)
+            storage_state_path: JSON file to load cookies and local storage
+                from, if it exists, and save them to when the context is
+                closed (default: None)
+            **options: Keyword arguments for Browser.new_context
+
+        Returns:
+            Shared BrowserContext instance
+        """
+        async with cls._get_lock():
+            context = cls._contexts.get(name)
+            if context is None:
+                browser = await cls._launch(headless)
+                if storage_state_path and os.path.exists(storage_state_path):
+                    options["storage_state"] = storage_state_path
+                    logger.info("Loading browser storage state from %s", storage_state_path)
+                context = await browser.new_context(**options)
+                if block_resources:
+                    await context.route("**/*", _block_heavy_resources)
+                cls._contexts[name] = context
+                if storage_state_path:
+                    cls._state_paths[name] = storage_state_path
+                logger.info("Created browser context '%s'", name)
+            return context
+
+    @classmethod
+    @asynccontextmanager
+    async def context(cls, name: str, **options: Any) -> AsyncIterator[BrowserContext]:
+        """
+        Use the context registered under a name.
+
+        The context stays open when the block exits so the next run reuses it.
+
+        Args:
+            name: Context name, typically the scraper class name
+            **options: Passed to get_context
+
+        Yields:
+            Shared BrowserContext instance
+        """
+        yield await cls.get_context(name, **options)
+
+    @classmethod
+    async def close_context(cls, name: str) -> None:
+        """
+        Close the context registered under a name, if any.
+
+        Its cookies and local storage are saved first if it was created
+        with a storage_state_path.
+
+        Args:
+            name: Context name
+        """
+        context = cls._contexts.pop(name, None)
+        state_path = cls._state_paths.pop(name, None)
+        if context is None:
+            return
+
+        if state_path:
+            await cls.save_storage_state(context, state_path)
+        await context.close()
+
+    @staticmethod
+    async def save_storage_state(context: BrowserContext, path: str) -> None:
+        """
+        Write a context's cookies and local storage to a file.
+
+        Failures are logged rather than raised so they never abort a run.
+
+        Args:
+            context: Browser context
+            path: JSON file to write
+        """
+        try:
+            await context.storage_state(path=path)
+        except Exception as e:
+            logger.warning("Could not save browser storage state to %s: %s", path, e)
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close all contexts, the browser and the Playwright driver."""
+        try:
+            for name in list(cls._contexts):
+                try:
+                    await cls.close_context(name)
+                except Exception as e:
+                    logger.warning("Error closing browser context '%s': %s", name, e)
+            if cls._browser:
+                await cls._browser.close()
+                logger.info("Browser closed")
+        finally:
+            cls._contexts.clear()
+            cls._state_paths.clear()
+            cls._browser = None
+            cls._lock = None
+            if cls._playwright:
+                await cls._playwright.stop()
+                cls._playwright = None
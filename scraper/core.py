@@ -3,39 +3,136 @@ Core scraper engine with Playwright and async support.
 """
 
 import asyncio
+import multiprocessing
+import os
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import List, Dict, Any, Optional, Union
+from urllib.parse import urlparse
+import httpx
+from playwright.async_api import Page, BrowserContext, Response
+from models.product import ScrapedProduct
+from scraper.browser import BrowserManager
+from scraper.pool import PagePool
+from scraper.revalidation import RevalidationCache
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# What scrapers return for a product; dicts are accepted for custom scrapers
+ProductData = Union[ScrapedProduct, Dict[str, Any]]
+
 
 class ProductScraper(ABC):
     """
     Abstract base class for product scrapers.
 
-    Subclasses must implement the scrape_product method to define
-    how to extract product data from a specific website.
+    Subclasses implement get_product_urls and define how to extract product
+    data from a specific website, either by overriding scrape_product to
+    drive the Playwright page directly, or by implementing parse_html to
+    extract data from the page's HTML.
+
+    parse_html should be a pure function of its arguments: when
+    scrape_product isn't overridden, the engine runs it in a separate
+    process so CPU-heavy parsing doesn't block the event loop. Scrapers
+    using it must therefore be picklable.
+
+    Scrapers for static pages should set needs_js to False: the engine
+    then downloads the HTML with a plain HTTP client instead of rendering
+    it in Chromium, and passes it to parse_html.
+
+    Attributes:
+        needs_js: Whether pages must be rendered in a browser (default: True)
+        concurrency: Maximum products of this scraper scraped at once, on
+            top of the engine's limits (default: None, the engine's limit)
+        storage_state_path: File the scraper's cookies and local storage
+            persist to between runs, for ScraperEngine (default: None)
     """
 
-    @abstractmethod
-    async def scrape_product(self, page: Page, url: str, product_id: int) -> Dict[str, Any]:
+    needs_js: bool = True
+    concurrency: Optional[int] = None
+    storage_state_path: Optional[str] = None
+
+    def __init_subclass__(cls, **kwargs: Any):
+        """
+        Reject concrete scrapers that override neither extraction method.
+
+        Without this, such a scraper would instantiate fine and then fail
+        on every URL at runtime.
+
+        Raises:
+            TypeError: If a subclass implementing get_product_urls overrides
+                neither scrape_product nor parse_html
+        """
+        super().__init_subclass__(**kwargs)
+
+        # Intermediate base classes may leave both to their subclasses
+        if getattr(cls.get_product_urls, "__isabstractmethod__", False):
+            return
+
+        if (
+            cls.scrape_product is ProductScraper.scrape_product
+            and cls.parse_html is ProductScraper.parse_html
+        ):
+            raise TypeError(f"{cls.__name__} must implement scrape_product or parse_html")
+
+    async def scrape_product(self, page: Page, url: str, product_id: int) -> ProductData:
         """
         Scrape a single product from the given URL.
 
+        The default implementation passes the HTML returned by fetch to
+        parse_html.
+
         Args:
             page: Playwright Page instance
             url: URL to scrape
             product_id: Unique identifier for the product
 
         Returns:
-            Dictionary containing product data
+            ScrapedProduct or dictionary with the product data
 
         Raises:
             Exception: If scraping fails
         """
-        pass
+        return self.parse_html(await self.fetch(page, url), url, product_id)
+
+    async def fetch(self, page: Page, url: str) -> str:
+        """
+        Load a product page and return its HTML.
+
+        Override to wait for or interact with dynamic content first.
+
+        Args:
+            page: Playwright Page instance
+            url: URL to load
+
+        Returns:
+            Page HTML
+        """
+        await page.goto(url, wait_until="domcontentloaded")
+        return await page.content()
+
+    def parse_html(self, html: str, url: str, product_id: int) -> ProductData:
+        """
+        Extract product data from a page's HTML.
+
+        Args:
+            html: Page HTML
+            url: URL the HTML was loaded from
+            product_id: Unique identifier for the product
+
+        Returns:
+            ScrapedProduct or dictionary with the product data
+
+        Raises:
+            NotImplementedError: If the scraper only overrides scrape_product
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} must implement scrape_product or parse_html"
+        )
 
     @abstractmethod
     def get_product_urls(self) -> List[str]:
@@ -53,22 +150,55 @@ class ScraperEngine:
     Main scraper engine managing concurrent scraping with Playwright.
 
     This class handles:
-    - Browser initialization and cleanup
-    - Concurrent task execution with semaphore control
+    - Concurrent task execution bounded by a pool of reusable pages
     - Error handling and retry logic
     - Memory-efficient browser context management
 
+    The browser and its contexts come from BrowserManager and outlive the
+    engine, so later engines with the same context_name skip the browser
+    launch and reuse the context's cookies and cache. Use the engine as
+    an async context manager to keep its page pool open across several
+    scrape calls; call ``await BrowserManager.close()`` when done. A
+    one-shot scrape_all on an engine that isn't entered cleans up after
+    itself: it closes the browser again if it launched it. The browser
+    context and page pool are only opened for the first page scrape, so
+    scrapers with needs_js set to False never launch Chromium.
+
     Attributes:
+        context_name: Name of the shared BrowserManager context to use
         max_concurrent: Maximum number of concurrent scraping tasks
+        max_concurrent_per_domain: Maximum concurrent tasks against one host
+        parse_workers: Number of processes running ProductScraper.parse_html
+        max_page_uses: Scrapes after which a pooled page is replaced
+        storage_state_path: File cookies and local storage persist to between runs
+        revalidation_cache_path: File storing per-URL validators for conditional re-crawls
         headless: Whether to run browser in headless mode
         timeout: Default timeout for page operations (ms)
+        block_resources: Whether images, media, fonts and stylesheets are blocked
+
+    Example:
+        >>> async with ScraperEngine(max_concurrent=10) as engine:
+        ...     first = await engine.scrape_all(scraper)
+        ...     more = await engine.scrape_batch(scraper, urls, start_id=100)
+        >>> await BrowserManager.close()
     """
 
+    # Engines currently holding the shared context; a one-shot scrape only
+    # closes the browser it launched when none are left
+    _open_engines: int = 0
+
     def __init__(
         self,
         max_concurrent: int = 10,
         headless: bool = True,
-        timeout: int = 30000
+        timeout: int = 30000,
+        block_resources: bool = True,
+        max_concurrent_per_domain: Optional[int] = None,
+        storage_state_path: Optional[str] = None,
+        revalidation_cache_path: Optional[str] = None,
+        parse_workers: Optional[int] = None,
+        context_name: str = "default",
+        max_page_uses: Optional[int] = 100
     ):
         """
         Initialize the scraper engine.
@@ -77,72 +207,488 @@ class ScraperEngine:
             max_concurrent: Maximum concurrent tasks (default: 10)
             headless: Run browser in headless mode (default: True)
             timeout: Page operation timeout in ms (default: 30000)
+            block_resources: Abort image, media, font and stylesheet
+                requests (default: True)
+            max_concurrent_per_domain: Maximum concurrent tasks against a
+                single host (default: same as max_concurrent)
+            storage_state_path: JSON file to load cookies and local storage
+                from on start and save them to on close (default: None)
+            revalidation_cache_path: JSON file with ETag / Last-Modified
+                validators of scraped URLs; when set, known URLs are
+                revalidated with a conditional GET and unchanged pages
+                reuse their previous data (default: None)
+            parse_workers: Processes used to run ProductScraper.parse_html
+                (default: one per CPU)
+            context_name: Name of the shared browser context, typically the
+                scraper class name (default: "default")
+            max_page_uses: Replace a pooled page after this many scrapes to
+                bound its memory growth; None keeps pages for the whole
+                run (default: 100)
         """
+        self.context_name = context_name
         self.max_concurrent = max_concurrent
         self.headless = headless
         self.timeout = timeout
-        self.semaphore = asyncio.Semaphore(max_concurrent)
-        self.browser: Optional[Browser] = None
+        self.block_resources = block_resources
+        self.max_concurrent_per_domain = max_concurrent_per_domain or max_concurrent
+        self._domain_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.storage_state_path = storage_state_path
+        self.revalidation_cache = (
+            RevalidationCache(revalidation_cache_path) if revalidation_cache_path else None
+        )
+        self.context: Optional[BrowserContext] = None
+        self._http: Optional[httpx.AsyncClient] = None
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        # Started on first use, so scrapers that never call parse_html don't pay for it
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        # Bounded pool of open pages; checking one out also caps concurrency.
+        # Opened with the browser context on the first page scrape, so
+        # scrapers with needs_js set to False never launch Chromium
+        self._page_pool: Optional[PagePool] = None
+        self._page_pool_lock = asyncio.Lock()
+        self._opened = False
+        self.max_page_uses = max_page_uses
         logger.info(
-            f"ScraperEngine initialized: max_concurrent={max_concurrent}, "
-            f"headless={headless}, timeout={timeout}ms"
+            "ScraperEngine initialized: max_concurrent=%d, "
+            "max_concurrent_per_domain=%d, "
+            "headless=%s, timeout=%dms",
+            max_concurrent, self.max_concurrent_per_domain, headless, timeout
+        )
+
+    async def __aenter__(self) -> "ScraperEngine":
+        """Open the engine; the browser context and page pool open on first use."""
+        await self._open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the page pool, leaving the shared context open."""
+        await self._close()
+
+    def _context_options(self) -> Dict[str, Any]:
+        """
+        Build the keyword arguments for the shared browser context.
+
+        Only used when BrowserManager creates the context, i.e. by the
+        first engine with a given context_name.
+
+        Returns:
+            Options for Browser.new_context
+        """
+        return {
+            "user_agent": USER_AGENT,
+            "java_script_enabled": True,
+        }
+
+    async def _open(self) -> None:
+        """Load the revalidation cache and open the HTTP client."""
+        if self._opened:
+            return
+
+        if self.revalidation_cache:
+            self.revalidation_cache.load()
+
+        # HTTP client for scrapers that don't need JavaScript
+        self._http = httpx.AsyncClient(
+            http2=True,
+            headers={"User-Agent": USER_AGENT},
+            follow_redirects=True,
+            timeout=self.timeout / 1000,
+            limits=httpx.Limits(max_connections=self.max_concurrent)
         )
 
-    async def _init_browser(self, playwright) -> Browser:
+        self._opened = True
+        ScraperEngine._open_engines += 1
+
+    async def _get_page_pool(self) -> PagePool:
         """
-        Initialize Playwright browser.
+        Get the page pool, opening the browser context and pool on first use.
+
+        Returns:
+            Page pool of the shared browser context
+        """
+        async with self._page_pool_lock:
+            if self._page_pool is None:
+                self.context = await BrowserManager.get_context(
+                    self.context_name,
+                    headless=self.headless,
+                    block_resources=self.block_resources,
+                    # Reuse cookies from a previous run so sessions survive restarts
+                    storage_state_path=self.storage_state_path,
+                    **self._context_options()
+                )
+                pool = PagePool(
+                    self.context,
+                    self.max_concurrent,
+                    self.timeout,
+                    max_uses=self.max_page_uses
+                )
+                # Open every page up front, concurrently, so the other URLs
+                # don't queue behind page creation
+                try:
+                    await pool.warmup()
+                except Exception:
+                    await pool.close()
+                    raise
+                self._page_pool = pool
+            return self._page_pool
+
+    async def _close(self) -> None:
+        """Close the page pool and HTTP client; the browser context stays open."""
+        if self.revalidation_cache:
+            self.revalidation_cache.save()
+
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+
+        if self._parse_pool:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+
+        try:
+            if self._page_pool:
+                await self._page_pool.close()
+                self._page_pool = None
+
+            # Checkpoint the session now; BrowserManager saves it again on close
+            if self.context and self.storage_state_path:
+                await BrowserManager.save_storage_state(self.context, self.storage_state_path)
+        finally:
+            if self._opened:
+                ScraperEngine._open_engines -= 1
+            self._opened = False
+            self.context = None
+
+    def _domain_semaphore(self, url: str) -> asyncio.Semaphore:
+        """
+        Get the semaphore limiting concurrent scrapes of the URL's host.
 
         Args:
-            playwright: Playwright instance
+            url: URL about to be scraped
 
         Returns:
-            Browser instance
+            Semaphore shared by all URLs on the same host
         """
-        logger.info("Launching browser...")
-        browser = await playwright.chromium.launch(headless=self.headless)
-        logger.info("Browser launched successfully")
-        return browser
+        host = urlparse(url).netloc
+        semaphore = self._domain_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrent_per_domain)
+            self._domain_semaphores[host] = semaphore
+        return semaphore
+
+    async def _revalidate(
+        self,
+        page: Page,
+        url: str,
+        product_id: int
+    ) -> Optional[ProductData]:
+        """
+        Reuse the last scraped data for a URL if the origin reports it unchanged.
 
-    async def _scrape_single_product(
+        Args:
+            page: Page whose request context sends the conditional GET
+            url: Product URL
+            product_id: ID to assign to the reused product
+
+        Returns:
+            Previous product data with the current ID, or None if the page
+            must be scraped again
+        """
+        headers = self.revalidation_cache.conditional_headers(url)
+        if not headers:
+            return None
+
+        try:
+            response = await page.request.get(url, headers=headers)
+            not_modified = response.status == 304
+            await response.dispose()
+        except Exception as e:
+            logger.warning("[ID:%d] Conditional GET failed for %s: %s", product_id, url, e)
+            return None
+
+        if not not_modified:
+            return None
+
+        logger.info("[ID:%d] Not modified since last scrape: %s", product_id, url)
+        return {**self.revalidation_cache.get_product(url), "id": product_id}
+
+    async def _parse_html(
         self,
-        context: BrowserContext,
         scraper: ProductScraper,
+        html: str,
         url: str,
         product_id: int
-    ) -> Optional[Dict[str, Any]]:
+    ) -> ProductData:
         """
-        Scrape a single product with error handling.
+        Run the scraper's parse_html in the process pool.
 
         Args:
-            context: Browser context
             scraper: ProductScraper instance
+            html: Page HTML
+            url: URL the HTML was loaded from
+            product_id: Product ID
+
+        Returns:
+            Product data
+        """
+        if self._parse_pool is None:
+            # spawn rather than fork: the parent runs Playwright and httpx threads
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._parse_pool, scraper.parse_html, html, url, product_id
+        )
+
+    async def _extract(
+        self,
+        scraper: ProductScraper,
+        page: Page,
+        url: str,
+        product_id: int
+    ) -> ProductData:
+        """
+        Extract a product with the scraper, offloading parse_html.
+
+        Scrapers that override scrape_product run it as is; the others are
+        split into fetch on the event loop and parse_html in the pool.
+
+        Args:
+            scraper: ProductScraper instance
+            page: Page to scrape with
             url: Product URL
             product_id: Product ID
 
         Returns:
-            Product data dict or None if failed
+            Product data
         """
-        async with self.semaphore:
-            page = None
-            try:
-                page = await context.new_page()
-                page.set_default_timeout(self.timeout)
+        if type(scraper).scrape_product is not ProductScraper.scrape_product:
+            return await scraper.scrape_product(page, url, product_id)
 
-                logger.info(f"[ID:{product_id}] Scraping {url}")
-                product_data = await scraper.scrape_product(page, url, product_id)
+        html = await scraper.fetch(page, url)
+        return await self._parse_html(scraper, html, url, product_id)
 
-                logger.info(f"[ID:{product_id}] Successfully scraped: {product_data.get('name', 'Unknown')}")
+    async def _scrape_page(
+        self,
+        scraper: ProductScraper,
+        page: Page,
+        url: str,
+        product_id: int
+    ) -> ProductData:
+        """
+        Scrape a product, recording the document's validator headers if
+        revalidation is enabled.
+
+        Args:
+            scraper: ProductScraper instance
+            page: Page to scrape with
+            url: Product URL
+            product_id: Product ID
+
+        Returns:
+            Product data
+        """
+        if not self.revalidation_cache:
+            return await self._extract(scraper, page, url, product_id)
+
+        validators: Dict[str, Optional[str]] = {}
+
+        def on_response(response: Response) -> None:
+            # Later navigation responses (after redirects) overwrite earlier ones
+            if response.request.is_navigation_request() and response.frame == page.main_frame:
+                validators["etag"] = response.headers.get("etag")
+                validators["last_modified"] = response.headers.get("last-modified")
+
+        page.on("response", on_response)
+        try:
+            product_data = await self._extract(scraper, page, url, product_id)
+        finally:
+            page.remove_listener("response", on_response)
+
+        self.revalidation_cache.put(
+            url,
+            product_data,
+            validators.get("etag"),
+            validators.get("last_modified")
+        )
+        return product_data
+
+    async def _scrape_with_page(
+        self,
+        scraper: ProductScraper,
+        url: str,
+        product_id: int
+    ) -> ProductData:
+        """
+        Scrape a product with a page checked out from the pool.
+
+        Args:
+            scraper: ProductScraper instance
+            url: Product URL
+            product_id: Product ID
+
+        Returns:
+            Product data
+        """
+        page_pool = await self._get_page_pool()
+        async with page_pool.acquire() as page:
+            if self.revalidation_cache:
+                product_data = await self._revalidate(page, url, product_id)
+                if product_data is not None:
+                    return product_data
+
+            logger.info("[ID:%d] Scraping %s", product_id, url)
+            return await self._scrape_page(scraper, page, url, product_id)
+
+    async def _scrape_static(
+        self,
+        scraper: ProductScraper,
+        url: str,
+        product_id: int
+    ) -> ProductData:
+        """
+        Scrape a product by downloading its HTML without a browser.
+
+        Args:
+            scraper: ProductScraper instance with needs_js set to False
+            url: Product URL
+            product_id: Product ID
+
+        Returns:
+            Product data
+        """
+        headers = self.revalidation_cache.conditional_headers(url) if self.revalidation_cache else {}
+
+        logger.info("[ID:%d] Fetching %s", product_id, url)
+        response = await self._http.get(url, headers=headers)
+
+        if response.status_code == 304 and headers:
+            logger.info("[ID:%d] Not modified since last scrape: %s", product_id, url)
+            return {**self.revalidation_cache.get_product(url), "id": product_id}
+
+        response.raise_for_status()
+        product_data = await self._parse_html(scraper, response.text, url, product_id)
+
+        if self.revalidation_cache:
+            self.revalidation_cache.put(
+                url,
+                product_data,
+                response.headers.get("etag"),
+                response.headers.get("last-modified")
+            )
+        return product_data
+
+    async def _scrape_single_product(
+        self,
+        scraper: ProductScraper,
+        url: str,
+        product_id: int,
+        limit: Optional[asyncio.Semaphore] = None
+    ) -> Optional[ProductData]:
+        """
+        Scrape a single product with error handling.
+
+        Waits for a free slot of the scraper's own limit, if any, then on
+        the URL's host and then for a free page from the pool, so at most
+        max_concurrent products are scraped at once and at most
+        max_concurrent_per_domain from the same host. Scrapers that don't
+        need JavaScript skip the page pool and use the shared HTTP client
+        instead.
+
+        Args:
+            scraper: ProductScraper instance
+            url: Product URL
+            product_id: Product ID
+            limit: Semaphore enforcing the scraper's concurrency (optional)
+
+        Returns:
+            Product data or None if failed
+        """
+        async with limit or nullcontext(), self._domain_semaphore(url):
+            try:
+                if scraper.needs_js:
+                    product_data = await self._scrape_with_page(scraper, url, product_id)
+                else:
+                    product_data = await self._scrape_static(scraper, url, product_id)
+
+                if isinstance(product_data, ScrapedProduct):
+                    name = product_data.name
+                else:
+                    name = product_data.get("name", "Unknown")
+                logger.info("[ID:%d] Successfully scraped: %s", product_id, name)
                 return product_data
 
             except Exception as e:
-                logger.error(f"[ID:{product_id}] Failed to scrape {url}: {str(e)}")
+                logger.error("[ID:%d] Failed to scrape %s: %s", product_id, url, e)
                 return None
 
+    async def _scrape_urls(
+        self,
+        scraper: ProductScraper,
+        urls: List[str],
+        start_id: int
+    ) -> List[ProductData]:
+        """
+        Scrape URLs concurrently in the shared context.
+
+        Opens the engine for the duration of the call if it
+        hasn't been entered as a context manager. In that case a browser
+        launched by this call is closed again afterwards, unless another
+        engine has opened in the meantime.
+
+        Args:
+            scraper: ProductScraper implementation
+            urls: List of URLs to scrape
+            start_id: ID assigned to the first URL
+
+        Returns:
+            List of successfully scraped products
+        """
+        if not self._opened:
+            launched = not BrowserManager.is_running()
+            try:
+                async with self:
+                    return await self._scrape_urls(scraper, urls, start_id)
             finally:
-                if page:
-                    await page.close()
+                # Static scrapers never launch it, so there's nothing to close
+                if launched and BrowserManager.is_running() and ScraperEngine._open_engines == 0:
+                    await BrowserManager.close()
+
+        limit = asyncio.Semaphore(scraper.concurrency) if scraper.concurrency else None
+        tasks = [
+            asyncio.create_task(
+                self._scrape_single_product(scraper, url, start_id + idx, limit)
+            )
+            for idx, url in enumerate(urls)
+        ]
 
-    async def scrape_all(self, scraper: ProductScraper) -> List[Dict[str, Any]]:
+        # Report progress as each task finishes rather than after all of them
+        succeeded = 0
+        for done, next_result in enumerate(asyncio.as_completed(tasks), start=1):
+            try:
+                if await next_result is not None:
+                    succeeded += 1
+            except asyncio.CancelledError:
+                # Propagate our own cancellation; a cancelled scrape is just dropped
+                if asyncio.current_task().cancelling():
+                    raise
+                logger.warning("Scrape task cancelled")
+            except Exception as e:
+                logger.error("Scrape task failed: %s", e)
+            logger.debug("Progress: %d/%d done, %d successful", done, len(tasks), succeeded)
+
+        # Keep results in URL order so IDs and file order stay stable
+        return [
+            task.result() for task in tasks
+            if not task.cancelled()
+            and task.exception() is None
+            and task.result() is not None
+        ]
+
+    async def scrape_all(self, scraper: ProductScraper) -> List[ProductData]:
         """
         Scrape all products using the provided scraper.
 
@@ -150,7 +696,7 @@ class ScraperEngine:
             scraper: ProductScraper implementation
 
         Returns:
-            List of scraped product dictionaries
+            List of scraped products
 
         Example:
             >>> engine = ScraperEngine(max_concurrent=10)
@@ -159,44 +705,19 @@ class ScraperEngine:
         """
         urls = scraper.get_product_urls()
         total_urls = len(urls)
-        logger.info(f"Starting scrape of {total_urls} products")
-
-        async with async_playwright() as playwright:
-            browser = await self._init_browser(playwright)
-            context = await browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            )
-
-            try:
-                # Create tasks for concurrent scraping
-                tasks = [
-                    self._scrape_single_product(context, scraper, url, idx + 1)
-                    for idx, url in enumerate(urls)
-                ]
-
-                # Execute all tasks concurrently
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Filter out None values and exceptions
-                products = [
-                    result for result in results
-                    if result is not None and not isinstance(result, Exception)
-                ]
+        logger.info("Starting scrape of %d products", total_urls)
 
-                logger.info(f"Scraping completed: {len(products)}/{total_urls} successful")
-                return products
+        products = await self._scrape_urls(scraper, urls, start_id=1)
 
-            finally:
-                await context.close()
-                await browser.close()
-                logger.info("Browser closed")
+        logger.info("Scraping completed: %d/%d successful", len(products), total_urls)
+        return products
 
     async def scrape_batch(
         self,
         scraper: ProductScraper,
         urls: List[str],
         start_id: int = 1
-    ) -> List[Dict[str, Any]]:
+    ) -> List[ProductData]:
         """
         Scrape a specific batch of URLs.
 
@@ -206,32 +727,11 @@ class ScraperEngine:
             start_id: Starting ID for products (default: 1)
 
         Returns:
-            List of scraped product dictionaries
+            List of scraped products
         """
-        logger.info(f"Starting batch scrape of {len(urls)} products")
+        logger.info("Starting batch scrape of %d products", len(urls))
 
-        async with async_playwright() as playwright:
-            browser = await self._init_browser(playwright)
-            context = await browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            )
+        products = await self._scrape_urls(scraper, urls, start_id)
 
-            try:
-                tasks = [
-                    self._scrape_single_product(context, scraper, url, start_id + idx)
-                    for idx, url in enumerate(urls)
-                ]
-
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                products = [
-                    result for result in results
-                    if result is not None and not isinstance(result, Exception)
-                ]
-
-                logger.info(f"Batch scraping completed: {len(products)}/{len(urls)} successful")
-                return products
-
-            finally:
-                await context.close()
-                await browser.close()
+        logger.info("Batch scraping completed: %d/%d successful", len(products), len(urls))
+        return products
@@ -4,13 +4,42 @@ Example scraper implementations for different e-commerce sites.
 These serve as templates and can be customized for real websites.
 """
 
-from typing import List, Dict, Any
+import functools
+import re
+from typing import List, Dict, Any, Optional
 from playwright.async_api import Page
+from models.product import ScrapedProduct
 from scraper.core import ProductScraper
+from scraper.parsing import prepare_selectors
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Mock product URLs for ExampleMercadoLibreScraper
+# In production, scrape actual search results
+_BASE_URLS = (
+    "https://example.com/product/smartphone-samsung-a54",
+    "https://example.com/product/iphone-13-128gb",
+    "https://example.com/product/xiaomi-redmi-note-12",
+    "https://example.com/product/motorola-edge-30",
+    "https://example.com/product/samsung-galaxy-s23",
+)
+
+# Mock listing URLs for ExampleOLXScraper are this prefix plus a number
+_OLX_URL_PREFIX = "https://example-olx.com/item/electronics-"
+
+
+@functools.lru_cache(maxsize=4096)
+def _slug_from_url(tail: str) -> str:
+    """Turn the last URL segment into a product name, e.g. "iphone-13" -> "Iphone 13"."""
+    return tail.replace("-", " ").title()
+
+
+@functools.lru_cache(maxsize=4096)
+def _placeholder_image_url(product_slug: str) -> str:
+    """Build the mock image URL for a product name."""
+    return f"https://via.placeholder.com/400x400?text={product_slug.replace(' ', '+')}"
+
 
 class ExampleMercadoLibreScraper(ProductScraper):
     """
@@ -21,19 +50,58 @@ class ExampleMercadoLibreScraper(ProductScraper):
 
     Note: This example uses mock data for demonstration purposes.
     Replace with actual Playwright selectors for production use.
+
+    Cookies and local storage persist to storage_state_path between runs,
+    so once real pages need a login, the session is reused instead of
+    logging in on every run.
     """
 
-    def __init__(self, search_query: str = "smartphone", max_products: int = 10):
+    storage_state_path = "state_mercadolibre.json"
+
+    # CSS selectors for real product pages, for scraper.parsing.extract_fields
+    SELECTORS = prepare_selectors({
+        "name": "h1.product-title",
+        "price": "span.price-tag",
+        "description": "div.description",
+        "rating": "span.rating",
+    })
+
+    # Mock data tables, built once instead of on every product
+    _BASE_PRICES = (299.99, 399.99, 499.99, 599.99, 699.99, 799.99, 899.99, 999.99)
+    _SMARTPHONE_RE = re.compile(r"smartphone|samsung|iphone|xiaomi|motorola", re.IGNORECASE)
+    _BASE_SPECS = {
+        "brand": None,
+        "condition": "New",
+        "warranty": "12 months",
+        "shipping": "Free shipping"
+    }
+    _PHONE_SPECS = {
+        "storage": "128GB",
+        "ram": "6GB",
+        "screen_size": "6.4 inches",
+        "camera": "48MP main camera",
+        "battery": "5000mAh"
+    }
+
+    def __init__(
+        self,
+        search_query: str = "smartphone",
+        max_products: int = 10,
+        concurrency: Optional[int] = None
+    ):
         """
         Initialize the scraper.
 
         Args:
             search_query: Search term for products
             max_products: Maximum number of products to scrape
+            concurrency: Maximum products scraped at once (default: the
+                engine's limit)
         """
         self.search_query = search_query
         self.max_products = max_products
-        logger.info(f"ExampleMercadoLibreScraper initialized: query='{search_query}', max={max_products}")
+        self.concurrency = concurrency
+        logger.info("ExampleMercadoLibreScraper initialized: query=%r, max=%d", search_query, max_products)
 
     def get_product_urls(self) -> List[str]:
         """
@@ -50,32 +118,24 @@ class ExampleMercadoLibreScraper(ProductScraper):
             List of product URLs
         """
         # Mock URLs for demonstration
-        # In production, scrape actual search results
-        base_urls = [
-            "https://example.com/product/smartphone-samsung-a54",
-            "https://example.com/product/iphone-13-128gb",
-            "https://example.com/product/xiaomi-redmi-note-12",
-            "https://example.com/product/motorola-edge-30",
-            "https://example.com/product/samsung-galaxy-s23",
-        ]
-
-        urls = base_urls[:self.max_products]
-        logger.info(f"Generated {len(urls)} product URLs")
+        urls = list(_BASE_URLS[:self.max_products])
+        logger.info("Generated %d product URLs", len(urls))
         return urls
 
-    async def scrape_product(self, page: Page, url: str, product_id: int) -> Dict[str, Any]:
+    async def scrape_product(self, page: Page, url: str, product_id: int) -> ScrapedProduct:
         """
         Scrape product data from a single product page.
 
         For demonstration purposes, this returns mock data.
-        In production, implement actual scraping logic:
+        In production, implement actual scraping logic. Rather than one
+        page.locator(...).text_content() round-trip to the browser per
+        field, fetch the HTML once and parse it locally with
+        scraper.parsing.extract_fields:
+
+            await page.goto(url, wait_until="domcontentloaded")
+            fields = await extract_fields(page, self.SELECTORS)
 
-        Example selectors (adjust for actual site):
-        - name: await page.locator('h1.product-title').text_content()
-        - price: await page.locator('span.price-tag').text_content()
-        - description: await page.locator('div.description').text_content()
-        - image: await page.locator('img.product-image').get_attribute('src')
-        - rating: await page.locator('span.rating').text_content()
+        Use scraper.parsing.parse_all for multi-value fields.
 
         Args:
             page: Playwright Page instance
@@ -83,65 +143,51 @@ class ExampleMercadoLibreScraper(ProductScraper):
             product_id: Product ID
 
         Returns:
-            Product data dictionary
+            Scraped product data
         """
         try:
-            # Navigate to product page
-            await page.goto(url, wait_until="domcontentloaded")
+            # Navigate to product page; the mock data only needs the URL, so
+            # don't wait for the DOM. Use "domcontentloaded" with real selectors.
+            await page.goto(url, wait_until="commit")
 
             # In production, extract real data using selectors
             # For now, return mock data based on URL
 
             # Extract product name from URL (mock approach)
-            product_slug = url.split("/")[-1].replace("-", " ").title()
+            product_slug = _slug_from_url(url.rpartition("/")[2])
 
             # Mock data - replace with actual scraping logic
-            product_data = {
-                "id": product_id,
-                "name": product_slug,
-                "image_url": f"https://via.placeholder.com/400x400?text={product_slug.replace(' ', '+')}",
-                "description": f"High-quality {product_slug.lower()} with excellent features and performance. "
-                              f"Perfect for everyday use with advanced capabilities.",
-                "price": self._mock_price(product_id),
-                "rating": round(4.0 + (product_id % 10) / 10, 1),
-                "specifications": self._mock_specifications(product_slug),
-                "source_url": url
-            }
-
-            logger.debug(f"[ID:{product_id}] Extracted data: {product_data['name']}")
+            product_data = ScrapedProduct(
+                id=product_id,
+                name=product_slug,
+                image_url=_placeholder_image_url(product_slug),
+                description=f"High-quality {product_slug.lower()} with excellent features and performance. "
+                            f"Perfect for everyday use with advanced capabilities.",
+                price=self._mock_price(product_id),
+                rating=round(4.0 + (product_id % 10) / 10, 1),
+                specifications=self._mock_specifications(product_slug),
+                source_url=url
+            )
+
+            logger.debug("[ID:%d] Extracted data: %s", product_id, product_data.name)
             return product_data
 
         except Exception as e:
-            logger.error(f"[ID:{product_id}] Error scraping {url}: {e}")
+            logger.error("[ID:%d] Error scraping %s: %s", product_id, url, e)
             raise
 
     def _mock_price(self, product_id: int) -> str:
         """Generate mock price based on product ID."""
-        base_prices = [299.99, 399.99, 499.99, 599.99, 699.99, 799.99, 899.99, 999.99]
-        price = base_prices[product_id % len(base_prices)]
-        return f"${price}"
+        return f"${self._BASE_PRICES[product_id % len(self._BASE_PRICES)]}"
 
     def _mock_specifications(self, product_name: str) -> Dict[str, Any]:
         """Generate mock specifications based on product name."""
-        specs = {
-            "brand": product_name.split()[0] if product_name else "Generic",
-            "condition": "New",
-            "warranty": "12 months",
-            "shipping": "Free shipping"
-        }
+        specs = self._BASE_SPECS.copy()
+        specs["brand"] = product_name.split(maxsplit=1)[0] if product_name.strip() else "Generic"
 
         # Add tech specs for smartphones
-        if "smartphone" in product_name.lower() or any(
-            brand in product_name.lower()
-            for brand in ["samsung", "iphone", "xiaomi", "motorola"]
-        ):
-            specs.update({
-                "storage": "128GB",
-                "ram": "6GB",
-                "screen_size": "6.4 inches",
-                "camera": "48MP main camera",
-                "battery": "5000mAh"
-            })
+        if self._SMARTPHONE_RE.search(product_name):
+            specs.update(self._PHONE_SPECS)
 
         return specs
 
@@ -150,32 +196,47 @@ class ExampleOLXScraper(ProductScraper):
     """
     Example scraper for OLX-style classified sites.
 
-    Template for scraping classified listing sites.
+    Template for scraping classified listing sites. Like the Mercado
+    Libre example, its session persists to storage_state_path.
     """
 
-    def __init__(self, category: str = "electronics", max_products: int = 10):
+    storage_state_path = "state_olx.json"
+
+    # CSS selectors for real listing pages, for scraper.parsing.extract_fields
+    SELECTORS = prepare_selectors({
+        "name": "h1.listing-title",
+        "price": "span.listing-price",
+        "description": "div.listing-description",
+    })
+
+    def __init__(
+        self,
+        category: str = "electronics",
+        max_products: int = 10,
+        concurrency: Optional[int] = None
+    ):
         """
         Initialize OLX-style scraper.
 
         Args:
             category: Product category
             max_products: Maximum products to scrape
+            concurrency: Maximum products scraped at once (default: the
+                engine's limit)
         """
         self.category = category
         self.max_products = max_products
-        logger.info(f"ExampleOLXScraper initialized: category='{category}', max={max_products}")
+        self.concurrency = concurrency
+        logger.info("ExampleOLXScraper initialized: category=%r, max=%d", category, max_products)
 
     def get_product_urls(self) -> List[str]:
         """Get list of product URLs from OLX-style site."""
         # Mock URLs for demonstration
-        urls = [
-            f"https://example-olx.com/item/electronics-{i}"
-            for i in range(1, self.max_products + 1)
-        ]
-        logger.info(f"Generated {len(urls)} OLX-style URLs")
+        urls = [_OLX_URL_PREFIX + i for i in map(str, range(1, self.max_products + 1))]
+        logger.info("Generated %d OLX-style URLs", len(urls))
         return urls
 
-    async def scrape_product(self, page: Page, url: str, product_id: int) -> Dict[str, Any]:
+    async def scrape_product(self, page: Page, url: str, product_id: int) -> ScrapedProduct:
         """
         Scrape product from OLX-style listing.
 
@@ -188,28 +249,29 @@ class ExampleOLXScraper(ProductScraper):
             Product data
         """
         try:
-            await page.goto(url, wait_until="domcontentloaded")
+            # Mock data only needs the URL; wait for the DOM with real selectors
+            await page.goto(url, wait_until="commit")
 
             # Mock data for demonstration
-            product_data = {
-                "id": product_id,
-                "name": f"Used Electronics Item #{product_id}",
-                "image_url": f"https://via.placeholder.com/300x300?text=Item+{product_id}",
-                "description": f"Pre-owned {self.category} item in good condition. "
-                              f"Well maintained and fully functional.",
-                "price": f"${100 + (product_id * 50)}",
-                "rating": None,  # OLX typically doesn't have ratings
-                "specifications": {
+            product_data = ScrapedProduct(
+                id=product_id,
+                name=f"Used Electronics Item #{product_id}",
+                image_url=f"https://via.placeholder.com/300x300?text=Item+{product_id}",
+                description=f"Pre-owned {self.category} item in good condition. "
+                            f"Well maintained and fully functional.",
+                price=f"${100 + (product_id * 50)}",
+                rating=None,  # OLX typically doesn't have ratings
+                specifications={
                     "condition": "Used - Good",
                     "category": self.category,
                     "location": "Local pickup available",
                     "seller_type": "Individual"
                 },
-                "source_url": url
-            }
+                source_url=url
+            )
 
             return product_data
 
         except Exception as e:
-            logger.error(f"[ID:{product_id}] Error scraping OLX-style page {url}: {e}")
+            logger.error("[ID:%d] Error scraping OLX-style page %s: %s", product_id, url, e)
             raise
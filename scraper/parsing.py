@@ -0,0 +1,114 @@
+"""
+HTML field extraction with selectolax.
+"""
+
+from typing import Dict, List, Optional, Tuple, Union
+from playwright.async_api import Page
+from selectolax.parser import HTMLParser
+
+# (CSS selector, field names it fills), one entry per distinct selector
+PreparedSelectors = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+# What the parse functions accept: a plain dict or a prepare_selectors result
+Selectors = Union[Dict[str, str], PreparedSelectors]
+
+
+def prepare_selectors(selectors: Dict[str, str]) -> PreparedSelectors:
+    """
+    Validate a selector set and group fields sharing a selector.
+
+    Call it once, e.g. for a class-level SELECTORS attribute, so pages
+    are parsed without preparing the selectors again. Plain dicts work
+    too, but they are prepared again on every call.
+
+    Only leading and trailing whitespace is stripped; whitespace inside a
+    selector can be significant, as in a[title="two  spaces"].
+
+    Args:
+        selectors: Field name to CSS selector
+
+    Returns:
+        Distinct selectors with the fields each one fills
+
+    Raises:
+        ValueError: If a selector is empty
+
+    Example:
+        >>> SELECTORS = prepare_selectors({"name": "h1.title", "price": "span.price"})
+    """
+    grouped: Dict[str, List[str]] = {}
+    for field, selector in selectors.items():
+        selector = selector.strip()
+        if not selector:
+            raise ValueError(f"Empty CSS selector for field {field!r}")
+        grouped.setdefault(selector, []).append(field)
+    return tuple((selector, tuple(fields)) for selector, fields in grouped.items())
+
+
+def parse_fields(html: str, selectors: Selectors) -> Dict[str, Optional[str]]:
+    """
+    Extract the text of the first element matching each CSS selector.
+
+    Pure function of its arguments, so it can run in ProductScraper.parse_html.
+
+    Args:
+        html: Page HTML
+        selectors: Field name to CSS selector, or the result of
+            prepare_selectors to skip preparing them on every page
+
+    Returns:
+        Field name to stripped text, None where no element matched
+
+    Example:
+        >>> parse_fields(html, {"name": "h1.product-title", "price": "span.price"})
+        {'name': 'Samsung Galaxy A54', 'price': '$299.99'}
+    """
+    tree = HTMLParser(html)
+    fields: Dict[str, Optional[str]] = {}
+    if isinstance(selectors, dict):
+        selectors = prepare_selectors(selectors)
+
+    for selector, names in selectors:
+        node = tree.css_first(selector)
+        text = node.text(strip=True) if node is not None else None
+        for name in names:
+            fields[name] = text
+    return fields
+
+
+def parse_all(html: str, selector: str) -> List[str]:
+    """
+    Extract the text of every element matching a CSS selector.
+
+    For multi-value fields such as specification rows or image galleries.
+
+    Args:
+        html: Page HTML
+        selector: CSS selector
+
+    Returns:
+        Stripped text of each matching element, in document order
+    """
+    return [node.text(strip=True) for node in HTMLParser(html).css(selector)]
+
+
+async def extract_fields(page: Page, selectors: Selectors) -> Dict[str, Optional[str]]:
+    """
+    Extract fields from a loaded page with a single round-trip to the browser.
+
+    Each Playwright locator call is a separate message to the browser; this
+    fetches the HTML once and runs every selector locally instead.
+
+    Args:
+        page: Playwright Page with the product loaded
+        selectors: Field name to CSS selector, or the result of
+            prepare_selectors
+
+    Returns:
+        Field name to stripped text, None where no element matched
+
+    Example:
+        >>> await page.goto(url, wait_until="domcontentloaded")
+        >>> fields = await extract_fields(page, {"name": "h1.product-title"})
+    """
+    return parse_fields(await page.content(), selectors)
@@ -0,0 +1,178 @@
+"""
+Pool of reusable Playwright pages.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
+from playwright.async_api import BrowserContext, Page
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class PagePool:
+    """
+    Bounded pool of open pages shared by concurrent scrapes.
+
+    Creating a page is an IPC round-trip to the browser, so pages are opened
+    once and handed out again after each use, reset to about:blank. Waiting
+    for a free page also caps how many scrapes run at once. Long-lived tabs
+    slowly accumulate memory, so a page can be retired after max_uses.
+
+    Attributes:
+        context: Browser context the pages belong to
+        max_pages: Number of pages in the pool
+        timeout: Default timeout for page operations (ms)
+        max_uses: Uses after which a page is replaced by a fresh one
+
+    Example:
+        >>> pool = PagePool(context, max_pages=5, max_uses=100)
+        >>> await pool.warmup()
+        >>> async with pool.acquire() as page:
+        ...     await page.goto(url)
+        >>> await pool.close()
+    """
+
+    def __init__(
+        self,
+        context: BrowserContext,
+        max_pages: int,
+        timeout: Optional[int] = None,
+        max_uses: Optional[int] = None
+    ):
+        """
+        Initialize the pool. Pages are opened by warmup or on first use.
+
+        Args:
+            context: Browser context to open pages in
+            max_pages: Number of pages in the pool
+            timeout: Default timeout for page operations in ms (optional)
+            max_uses: Replace a page after this many uses (default: never)
+        """
+        self.context = context
+        self.max_pages = max_pages
+        self.timeout = timeout
+        self.max_uses = max_uses
+        # One permit per slot; a slot holds an idle page or is empty until
+        # acquire opens a page for it, so a failed page never shrinks the pool
+        self._slots = asyncio.Semaphore(max_pages)
+        self._idle: List[Page] = []
+        self._in_use = 0
+        self._uses: Dict[Page, int] = {}
+
+    async def _new_page(self) -> Page:
+        """
+        Open a page in the pool's context.
+
+        Returns:
+            New Page instance
+        """
+        page = await self.context.new_page()
+        if self.timeout is not None:
+            page.set_default_timeout(self.timeout)
+        return page
+
+    async def warmup(self, n: Optional[int] = None) -> None:
+        """
+        Open pages concurrently so the first scrapes don't wait for them.
+
+        Args:
+            n: Number of pages to open, capped by the empty slots in the
+                pool (default: fill the pool)
+
+        Raises:
+            Exception: The first error raised while opening a page; pages
+                that did open are kept
+        """
+        free = self.max_pages - len(self._idle) - self._in_use
+        n = free if n is None else min(n, free)
+        if n <= 0:
+            return
+
+        pages = await asyncio.gather(
+            *(self._new_page() for _ in range(n)),
+            return_exceptions=True
+        )
+        errors = [page for page in pages if isinstance(page, BaseException)]
+        self._idle.extend(page for page in pages if not isinstance(page, BaseException))
+        if errors:
+            raise errors[0]
+
+    async def _discard(self, page: Page) -> None:
+        """
+        Close a page and leave its slot empty for acquire to refill.
+
+        Args:
+            page: Page to close
+        """
+        self._uses.pop(page, None)
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+    async def _release(self, page: Page) -> None:
+        """
+        Reset a page and return it to the pool.
+
+        Pages that can't be reset or reached max_uses are closed instead;
+        the next acquire opens a fresh page in their slot.
+
+        Args:
+            page: Page previously taken from the pool
+        """
+        uses = self._uses.get(page, 0) + 1
+        if self.max_uses is not None and uses >= self.max_uses:
+            logger.debug("Recycling page after %d uses", uses)
+            await self._discard(page)
+            return
+
+        try:
+            await page.goto("about:blank")
+        except Exception as e:
+            logger.warning("Replacing page that failed to reset: %s", e)
+            await self._discard(page)
+            return
+
+        self._uses[page] = uses
+        self._idle.append(page)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Page]:
+        """
+        Check a page out of the pool, waiting until one is free.
+
+        Yields:
+            Page to use until the block exits
+
+        Raises:
+            Exception: If a page had to be opened and the browser refused;
+                the slot stays available for the next caller
+        """
+        await self._slots.acquire()
+        try:
+            page = self._idle.pop() if self._idle else await self._new_page()
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self._in_use += 1
+        try:
+            yield page
+        finally:
+            try:
+                await self._release(page)
+            finally:
+                self._in_use -= 1
+                self._slots.release()
+
+    async def close(self) -> None:
+        """Close all idle pages in the pool."""
+        self._uses.clear()
+        pages, self._idle = self._idle, []
+        for page in pages:
+            try:
+                await page.close()
+            except Exception:
+                pass
@@ -0,0 +1,147 @@
+"""
+HTTP validator cache for re-crawling product pages with conditional requests.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+from models.product import ScrapedProduct
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RevalidationCache:
+    """
+    ETag / Last-Modified validators and last scraped data per URL.
+
+    Stored as a JSON sidecar file so a re-crawl can ask the origin whether a
+    page changed (If-None-Match / If-Modified-Since) and reuse the previous
+    result on a 304 instead of loading the page again.
+
+    Attributes:
+        file_path: Path to the JSON sidecar file
+    """
+
+    def __init__(self, file_path: str = "revalidation.json"):
+        """
+        Initialize the cache.
+
+        Args:
+            file_path: Path to the JSON sidecar file (default: revalidation.json)
+        """
+        self.file_path = file_path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+
+    def load(self) -> None:
+        """Load entries from the sidecar file, starting empty if it's missing or invalid."""
+        path = Path(self.file_path)
+
+        if not path.exists():
+            return
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self._entries = json.load(f)
+            logger.info("Loaded validators for %d URLs from %s", len(self._entries), self.file_path)
+        except Exception as e:
+            logger.warning("Ignoring unreadable revalidation cache %s: %s", self.file_path, e)
+            self._entries = {}
+
+    def save(self) -> None:
+        """Write entries back to the sidecar file if they changed."""
+        if not self._dirty:
+            return
+
+        path = Path(self.file_path)
+        tmp_path = None
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique name, so concurrent saves never write into the same file
+            fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+            with open(fd, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+            tmp_path = None
+            self._dirty = False
+            logger.info("Saved validators for %d URLs to %s", len(self._entries), self.file_path)
+        except Exception as e:
+            logger.error("Error saving revalidation cache %s: %s", self.file_path, e)
+        finally:
+            if tmp_path:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Build conditional request headers for a previously scraped URL.
+
+        Args:
+            url: Product URL
+
+        Returns:
+            If-None-Match / If-Modified-Since headers, empty if the URL is unknown
+        """
+        entry = self._entries.get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def get_product(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the product data last scraped from a URL.
+
+        Args:
+            url: Product URL
+
+        Returns:
+            Product data dict or None if the URL is unknown
+        """
+        entry = self._entries.get(url)
+        return entry["product"] if entry else None
+
+    def put(
+        self,
+        url: str,
+        product: Union[ScrapedProduct, Dict[str, Any]],
+        etag: Optional[str],
+        last_modified: Optional[str]
+    ) -> None:
+        """
+        Record the validators and data of a freshly scraped URL.
+
+        URLs served without any validator aren't stored since they can't be
+        revalidated.
+
+        Args:
+            url: Product URL
+            product: Scraped product data
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+        """
+        if not etag and not last_modified:
+            if self._entries.pop(url, None) is not None:
+                self._dirty = True
+            return
+
+        if isinstance(product, ScrapedProduct):
+            product = product.to_dict()
+
+        self._entries[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "product": product
+        }
+        self._dirty = True
@@ -0,0 +1,61 @@
+"""
+Tests for utils.helpers.
+"""
+
+import pytest
+from utils.helpers import parse_price
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("299.99", (299.99, "USD")),
+    ("$1,299.99", (1299.99, "USD")),
+    ("1.299,99", (1299.99, "USD")),
+    ("1,299", (1299.0, "USD")),
+    ("1.299", (1299.0, "USD")),
+    ("1.299.000", (1299000.0, "USD")),
+    ("1,299,000.50", (1299000.5, "USD")),
+    ("$0.125", (0.125, "USD")),
+    ("1234.567", (1234.567, "USD")),
+    ("12345,5", (12345.5, "USD")),
+    ("10.", (10.0, "USD")),
+])
+def test_parse_price_separators(value, expected):
+    assert parse_price(value) == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("R$ 1.299,90", (1299.9, "BRL")),
+    ("US$ 5", (5.0, "USD")),
+    ("S/ 20.50", (20.5, "PEN")),
+    ("€10", (10.0, "EUR")),
+    ("10 €", (10.0, "EUR")),
+    ("1.299,90 €", (1299.9, "EUR")),
+    ("EUR 10", (10.0, "EUR")),
+    ("10 eur", (10.0, "EUR")),
+    ("$ 10 USD", (10.0, "USD")),
+])
+def test_parse_price_currency(value, expected):
+    assert parse_price(value) == expected
+
+
+def test_parse_price_default_currency():
+    assert parse_price("10", default_currency="BRL") == (10.0, "BRL")
+    assert parse_price(10, default_currency="BRL") == (10.0, "BRL")
+    assert parse_price("£10", default_currency="BRL") == (10.0, "GBP")
+
+
+@pytest.mark.parametrize("value", [
+    "",
+    "Consultar",
+    "-5",
+    "$-5",
+    "1..2",
+    "12,34,567",
+    "1.2.3,4",
+    "$10/mo",
+    "10 XYZ",
+    "€10 USD",
+])
+def test_parse_price_rejects(value):
+    with pytest.raises(ValueError):
+        parse_price(value)
@@ -3,6 +3,7 @@ Utility modules for logging and helper functions.
 """
 
 from .logger import get_logger
-from .helpers import load_products, save_products
+from .helpers import load_products, save_products, asave_products, save_products_append
+from .storage import ProductStore
 
-__all__ = ["get_logger", "load_products", "save_products"]
+__all__ = ["get_logger", "load_products", "save_products", "asave_products", "save_products_append", "ProductStore"]
@@ -2,54 +2,193 @@
 Helper functions for file operations and data management.
 """
 
-import json
-from pathlib import Path
-from typing import List, Dict, Any
+import asyncio
+import os
+import re
+import stat
+import tempfile
+from itertools import chain
+from typing import List, Dict, Any, Optional, Tuple
+import orjson
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Non-string spec keys are stringified like json.dump does
+JSON_DUMP_OPTIONS = orjson.OPT_NON_STR_KEYS
 
-def load_products(file_path: str = "products.json") -> List[Dict[str, Any]]:
+# Write buffer for JSON Lines appends; one flush covers most scraper runs
+APPEND_BUFFER_SIZE = 1 << 20
+
+DEFAULT_CURRENCY = "USD"
+
+# Schemes accepted for product image and source URLs
+_URL_SCHEMES = ("http://", "https://")
+
+# Currency symbols seen on supported sites, mapped to ISO 4217 codes
+CURRENCY_SYMBOLS = {
+    "$": "USD",
+    "US$": "USD",
+    "€": "EUR",
+    "£": "GBP",
+    "R$": "BRL",
+    "S/": "PEN",
+}
+
+# ISO 4217 codes accepted when a price spells out its currency, e.g. "EUR 10"
+CURRENCY_CODES = frozenset({
+    "ARS", "AUD", "BOB", "BRL", "CAD", "CHF", "CLP", "CNY", "COP", "CRC",
+    "EUR", "GBP", "JPY", "MXN", "PEN", "PYG", "USD", "UYU", "VES",
+})
+
+# Amount with an optional currency before or after it, e.g. "$1,299.99",
+# "EUR 10" or "1.299,90 €"; a leading minus sign never matches
+_PRICE_PATTERN = re.compile(r"\s*([^\d\s.,-]*)\s*(\d[\d.,]*)\s*([^\d\s.,]*)\s*")
+
+
+def _read_file(path: str) -> memoryview:
     """
-    Load products from JSON file.
+    Read a whole file into a buffer sized from its stat.
+
+    Unbuffered reads straight into one preallocated buffer avoid the
+    intermediate copies and growth reallocations of a plain read().
 
     Args:
-        file_path: Path to the JSON file (default: products.json)
+        path: File to read
+
+    Returns:
+        View over the file contents
+    """
+    with open(path, "rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        buf = bytearray(size)
+        view = memoryview(buf)
+        read = 0
+        while read < size:
+            n = f.readinto(view[read:])
+            if not n:
+                break
+            read += n
+    return view[:read]
+
+
+def _infer_format(file_path: str, fmt: Optional[str]) -> str:
+    """
+    Resolve the product file format from an explicit value or the suffix.
+
+    Args:
+        file_path: Path to the products file
+        fmt: "json", "jsonl" or None to go by the file suffix
+
+    Returns:
+        "json" or "jsonl"
+    """
+    if fmt is not None:
+        return fmt
+    return "jsonl" if file_path.endswith(".jsonl") else "json"
+
+
+def _load_jsonl(path: str) -> List[Dict[str, Any]]:
+    """
+    Read a JSON Lines product file line by line.
+
+    The file is an append log, so a later line with the same ID replaces
+    the earlier one in place. Lines that aren't a JSON object, typically a
+    last line cut short by a crash mid-append, are skipped with a warning
+    so the rest of the log still loads.
+
+    Args:
+        path: File to read
 
     Returns:
         List of product dictionaries
+    """
+    products: Dict[Any, Dict[str, Any]] = {}
+    with open(path, "rb") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                product = orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                logger.warning("Skipping invalid line %d in %s: %s", line_no, path, e)
+                continue
+            if not isinstance(product, dict):
+                logger.warning("Skipping line %d in %s: not a JSON object", line_no, path)
+                continue
+            products[product.get("id")] = product
+    return list(products.values())
 
-    Raises:
-        FileNotFoundError: If the file doesn't exist
-        json.JSONDecodeError: If the file contains invalid JSON
+
+def load_products(
+    file_path: str = "products.json",
+    fmt: Optional[str] = None,
+    *,
+    strict: bool = False
+) -> List[Dict[str, Any]]:
     """
-    path = Path(file_path)
+    Load products from a JSON or JSON Lines file.
 
-    if not path.exists():
-        logger.warning(f"File {file_path} not found, returning empty list")
-        return []
+    Args:
+        file_path: Path to the products file (default: products.json)
+        fmt: "json" for a single JSON array, "jsonl" for one product per
+            line (default: inferred from the file suffix)
+        strict: Raise read and decode errors instead of logging them, for
+            callers that cache the result (default: False)
 
+    Returns:
+        List of product dictionaries
+
+    Raises:
+        OSError, orjson.JSONDecodeError: If strict and the file can't be
+            read or decoded
+
+    A missing file yields an empty list. Other errors are logged and yield
+    an empty list unless strict is set.
+    """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            logger.info(f"Loaded {len(data)} products from {file_path}")
-            return data
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in {file_path}: {e}")
+        if _infer_format(file_path, fmt) == "jsonl":
+            data = _load_jsonl(file_path)
+        else:
+            data = orjson.loads(_read_file(file_path))
+        logger.info("Loaded %d products from %s", len(data), file_path)
+        return data
+    except FileNotFoundError:
+        # Opening directly instead of checking exists() first saves a stat
+        logger.warning("File %s not found, returning empty list", file_path)
+        return []
+    except orjson.JSONDecodeError as e:
+        logger.error("Invalid JSON in %s: %s", file_path, e)
+        if strict:
+            raise
         return []
     except Exception as e:
-        logger.error(f"Error loading products from {file_path}: {e}")
+        logger.error("Error loading products from %s: %s", file_path, e)
+        if strict:
+            raise
         return []
 
 
-def save_products(products: List[Dict[str, Any]], file_path: str = "products.json") -> bool:
+def save_products(
+    products: List[Dict[str, Any]],
+    file_path: str = "products.json",
+    *,
+    pretty: bool = False
+) -> bool:
     """
     Save products to JSON file.
 
+    The data is written to a uniquely named temporary file in the same
+    directory which then replaces the target in one atomic rename, so
+    readers never see a partially written file, a crash mid-write leaves the
+    old file intact and concurrent saves never write into each other's file.
+    The JSON is encoded to UTF-8 bytes by orjson and written unbuffered.
+
     Args:
         products: List of product dictionaries to save
         file_path: Path to the JSON file (default: products.json)
+        pretty: Indent the output by two spaces for reading by humans;
+            the default compact output is smaller and faster to load
 
     Returns:
         True if successful, False otherwise
@@ -59,19 +198,127 @@ def save_products(products: List[Dict[str, Any]], file_path: str = "products.jso
         >>> save_products(products, "products.json")
         True
     """
-    path = Path(file_path)
+    directory, name = os.path.split(file_path)
+    tmp_path = None
 
     try:
         # Ensure parent directory exists
-        path.parent.mkdir(parents=True, exist_ok=True)
+        os.makedirs(directory or ".", exist_ok=True)
+
+        option = JSON_DUMP_OPTIONS | orjson.OPT_INDENT_2 if pretty else JSON_DUMP_OPTIONS
+        data = orjson.dumps(products, option=option)
+
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory or ".")
+        with open(fd, "wb", buffering=0) as f:
+            # mkstemp creates the file owner-only; keep the target's mode
+            os.fchmod(fd, _file_mode(file_path))
+            view = memoryview(data)
+            while view:
+                view = view[f.write(view):]
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, file_path)
+        tmp_path = None
+
+        logger.info("Saved %d products to %s", len(products), file_path)
+        return True
+    except Exception as e:
+        logger.error("Error saving products to %s: %s", file_path, e)
+        return False
+    finally:
+        if tmp_path:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def _file_mode(path: str) -> int:
+    """
+    Get the permission bits a rewritten file should keep.
+
+    Args:
+        path: File about to be replaced
+
+    Returns:
+        The file's current mode, or 0o644 if it doesn't exist yet
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o644
+
+
+async def asave_products(
+    products: List[Dict[str, Any]],
+    file_path: str = "products.json",
+    *,
+    pretty: bool = False
+) -> bool:
+    """
+    Save products to JSON file without blocking the event loop.
+
+    Runs save_products in the default thread pool, so the write keeps its
+    atomic replace while other scrapes continue.
+
+    Args:
+        products: List of product dictionaries to save
+        file_path: Path to the JSON file (default: products.json)
+        pretty: Indent the output by two spaces (default: False)
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(products, f, indent=2, ensure_ascii=False)
+    Returns:
+        True if successful, False otherwise
+
+    Example:
+        >>> await asave_products(products, "products.json")
+        True
+    """
+    return await asyncio.to_thread(save_products, products, file_path, pretty=pretty)
+
+
+def save_products_append(
+    products: List[Dict[str, Any]],
+    file_path: str = "products.jsonl"
+) -> bool:
+    """
+    Append products to a JSON Lines file, one product per line.
+
+    Unlike save_products, only the given products are written, so an
+    incremental run costs O(new) instead of rewriting the whole file.
+    Products that are already in the file are appended again and replace
+    the old line when loaded (see load_products).
+
+    Args:
+        products: List of product dictionaries to append
+        file_path: Path to the JSON Lines file (default: products.jsonl)
+
+    Returns:
+        True if successful, False otherwise
+
+    Example:
+        >>> save_products_append([{"id": 6, "name": "Product 6", ...}])
+        True
+    """
+    try:
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
 
-        logger.info(f"Saved {len(products)} products to {file_path}")
+        with open(file_path, "a+b", buffering=APPEND_BUFFER_SIZE) as f:
+            # Start on a fresh line if a crash left the last one unterminated,
+            # so the first new product isn't glued onto the broken line
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            for product in products:
+                f.write(orjson.dumps(product, option=JSON_DUMP_OPTIONS))
+                f.write(b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        logger.info("Appended %d products to %s", len(products), file_path)
         return True
     except Exception as e:
-        logger.error(f"Error saving products to {file_path}: {e}")
+        logger.error("Error appending products to %s: %s", file_path, e)
         return False
 
 
@@ -82,6 +329,9 @@ def merge_products(
     """
     Merge new products with existing ones, avoiding duplicates by ID.
 
+    Later entries win: a new product replaces the existing one with the same
+    ID, keeping its position. Products without an ID are dropped.
+
     Args:
         existing: List of existing product dictionaries
         new_products: List of new product dictionaries to merge
@@ -96,16 +346,154 @@ def merge_products(
         >>> len(merged)
         2
     """
-    # Create a dict indexed by ID for O(1) lookup
-    products_dict = {p.get("id"): p for p in existing}
+    # One pass over both lists, indexed by ID
+    merged = list({
+        p["id"]: p
+        for p in chain(existing, new_products)
+        if p.get("id") is not None
+    }.values())
+    logger.info("Merged products: %d total", len(merged))
+    return merged
 
-    # Update or add new products
-    for product in new_products:
-        product_id = product.get("id")
-        if product_id is not None:
-            products_dict[product_id] = product
 
-    # Return as list
-    merged = list(products_dict.values())
-    logger.info(f"Merged products: {len(merged)} total")
-    return merged
+def parse_price(
+    value: str | float,
+    default_currency: str = DEFAULT_CURRENCY
+) -> Tuple[float, str]:
+    """
+    Parse a scraped price into an amount and a currency code.
+
+    Handles both "1,299.99" and "1.299,99" style separators, and a currency
+    symbol or ISO 4217 code on either side of the amount.
+
+    Args:
+        value: Price as scraped, e.g. "$299.99", "R$ 1.299,90", "10 €"
+            or 299.99
+        default_currency: Currency used when the value has no symbol
+
+    Returns:
+        Tuple of (amount, ISO 4217 currency code)
+
+    Raises:
+        ValueError: If the value isn't a non-negative price, or its
+            currency isn't a known symbol or code
+
+    Example:
+        >>> parse_price("$1,299.99")
+        (1299.99, 'USD')
+    """
+    if isinstance(value, (int, float)):
+        return float(value), default_currency
+
+    match = _PRICE_PATTERN.fullmatch(value)
+    if not match:
+        raise ValueError(f"Unrecognized price: {value!r}")
+
+    prefix, amount, suffix = match.groups()
+    if prefix and suffix:
+        currency = _currency_code(prefix, value)
+        if _currency_code(suffix, value) != currency:
+            raise ValueError(f"Conflicting currencies in price: {value!r}")
+    elif prefix or suffix:
+        currency = _currency_code(prefix or suffix, value)
+    else:
+        currency = default_currency
+
+    # The last separator is the decimal one unless it can only be grouping:
+    # repeated ("1.299.000"), or the sole separator with exactly three digits
+    # after it and a 1-3 digit integer part without a leading zero ("1,299",
+    # but not "0.125")
+    last_sep = max(amount.rfind(","), amount.rfind("."))
+    if last_sep != -1:
+        sep = amount[last_sep]
+        other = "." if sep == "," else ","
+        integer_part = amount[:last_sep]
+        is_grouping = other not in amount and (
+            amount.count(sep) > 1
+            or (
+                len(amount) - last_sep - 1 == 3
+                and len(integer_part) <= 3
+                and not integer_part.startswith("0")
+            )
+        )
+        if is_grouping:
+            if not _is_grouped(amount, sep):
+                raise ValueError(f"Unrecognized price: {value!r}")
+            amount = amount.replace(sep, "")
+        else:
+            if not (integer_part.isdigit() or _is_grouped(integer_part, other)):
+                raise ValueError(f"Unrecognized price: {value!r}")
+            amount = integer_part.replace(other, "") + "." + amount[last_sep + 1:]
+
+    return float(amount), currency
+
+
+def _is_grouped(digits: str, sep: str) -> bool:
+    """Check that digits are split into thousands by sep, e.g. "1,299,000"."""
+    return all(len(group) == 3 for group in digits.split(sep)[1:]) and (
+        0 < len(digits.partition(sep)[0]) <= 3
+    )
+
+
+def _currency_code(text: str, value: str) -> str:
+    """
+    Resolve a currency symbol or code found next to a price.
+
+    Args:
+        text: Symbol or code, e.g. "R$" or "eur"
+        value: The whole price, for the error message
+
+    Returns:
+        ISO 4217 currency code
+
+    Raises:
+        ValueError: If the text isn't a known symbol or code
+    """
+    code = CURRENCY_SYMBOLS.get(text) or text.upper()
+    if code not in CURRENCY_CODES:
+        raise ValueError(f"Unknown currency {text!r} in price: {value!r}")
+    return code
+
+
+def normalize_product(product: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a scraped or stored product to the stored format.
+
+    Prices are parsed once here into a float plus currency code so the API
+    only ever validates concrete types. URLs are checked here too, once per
+    product, so the model can keep them as plain strings. Already-normalized
+    products pass through unchanged, which migrates files written by older
+    versions: the API runs stored rows through here too, so a file still
+    holding string prices like "$299.99" is served without a re-scrape.
+
+    Args:
+        product: Product dictionary as returned by a scraper or as stored
+
+    Returns:
+        Product dictionary matching the Product model
+
+    Raises:
+        KeyError: If a required field is missing
+        ValueError: If the price can't be parsed or a URL isn't http(s)
+    """
+    image_url = product["image_url"]
+    source_url = product.get("source_url")
+    if not image_url.startswith(_URL_SCHEMES):
+        raise ValueError(f"Invalid image URL: {image_url!r}")
+    if source_url is not None and not source_url.startswith(_URL_SCHEMES):
+        raise ValueError(f"Invalid source URL: {source_url!r}")
+
+    price, currency = parse_price(product["price"], product.get("currency", DEFAULT_CURRENCY))
+    rating = product.get("rating")
+
+    return {
+        "id": product["id"],
+        "name": product["name"],
+        "image_url": image_url,
+        "description": product["description"],
+        "price": price,
+        "currency": currency,
+        "rating": float(rating) if rating is not None else None,
+        "specifications": product.get("specifications", {}),
+        "source_url": source_url
+    }
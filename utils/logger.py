@@ -2,30 +2,108 @@
 Logging configuration for the scraper application.
 """
 
+import atexit
+import functools
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import Optional
 
+# Format: [2025-10-22 10:30:45] [INFO] [module_name] Message
+_FORMATTER = logging.Formatter(
+    "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
 
-def get_logger(
+
+# Argument types that can't change between the logging call and formatting
+_IMMUTABLE_ARG_TYPES = (str, int, float, bytes, type(None))
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a listener in the same process.
+
+    The stock prepare formats the message on the calling thread so the
+    record can be pickled; records here never leave the process, so the
+    common case of plain string and number arguments is queued as is and
+    formatted on the listener thread.
+
+    Anything else is rendered before queueing: a list or dict argument the
+    caller mutates right after the call would otherwise be logged in its
+    changed state, and a pending exc_info would keep the traceback's frames
+    (and every local in them) alive until the listener gets to it.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Render the parts of a record that may change or pin memory.
+
+        Args:
+            record: Record about to be queued
+
+        Returns:
+            The same record, with mutable arguments and exc_info rendered
+        """
+        args = record.args
+        if args and not (
+            isinstance(args, tuple)
+            and all(isinstance(arg, _IMMUTABLE_ARG_TYPES) for arg in args)
+        ):
+            record.msg = record.getMessage()
+            record.args = None
+
+        if record.exc_info:
+            record.exc_text = _FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+
+        return record
+
+
+@functools.lru_cache(maxsize=None)
+def _queue_handler(log_file: Optional[str]) -> logging.Handler:
+    """
+    Get the handler queueing records for one destination.
+
+    The first call per destination starts a QueueListener thread that owns
+    the real stream or file handler, so formatting and writes happen off
+    the caller's thread (the scraper's event loop) and never block it.
+
+    Args:
+        log_file: File path to write logs to, or None for stdout
+
+    Returns:
+        Handler shared by all loggers writing to the destination
+    """
+    target = logging.FileHandler(log_file) if log_file else logging.StreamHandler(sys.stdout)
+    target.setFormatter(_FORMATTER)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, target, respect_handler_level=True)
+    listener.start()
+    # Flush queued records before the interpreter exits
+    atexit.register(listener.stop)
+
+    return _InProcessQueueHandler(log_queue)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_logger(
     name: str,
-    level: int = logging.INFO,
-    log_file: Optional[str] = None
+    level: int,
+    log_file: Optional[str]
 ) -> logging.Logger:
     """
-    Get a configured logger instance.
+    Configure a logger once per (name, level, log_file).
 
     Args:
-        name: Logger name (usually __name__ of the module)
-        level: Logging level (default: INFO)
+        name: Logger name
+        level: Logging level
         log_file: Optional file path to write logs to
 
     Returns:
         Configured logger instance
-
-    Example:
-        >>> logger = get_logger(__name__)
-        >>> logger.info("Application started")
     """
     logger = logging.getLogger(name)
 
@@ -34,24 +112,41 @@ def get_logger(
         return logger
 
     logger.setLevel(level)
+    # Records are emitted by the handlers below only, not again by the root logger
+    logger.propagate = False
 
-    # Console handler with formatting
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-
-    # Format: [2025-10-22 10:30:45] [INFO] [module_name] Message
-    formatter = logging.Formatter(
-        "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    # Console output
+    logger.addHandler(_queue_handler(None))
 
-    # Optional file handler
+    # Optional file output
     if log_file:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        logger.addHandler(_queue_handler(log_file))
 
     return logger
+
+
+def get_logger(
+    name: str,
+    level: int = logging.INFO,
+    log_file: Optional[str] = None
+) -> logging.Logger:
+    """
+    Get a configured logger instance.
+
+    Loggers are configured on the first call and cached. Records are
+    queued and written by a background thread per destination, sharing
+    one formatter.
+
+    Args:
+        name: Logger name (usually __name__ of the module)
+        level: Logging level (default: INFO)
+        log_file: Optional file path to write logs to
+
+    Returns:
+        Configured logger instance
+
+    Example:
+        >>> logger = get_logger(__name__)
+        >>> logger.info("Application started")
+    """
+    return _cached_logger(name, level, log_file)
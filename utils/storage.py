@@ -0,0 +1,183 @@
+"""
+SQLite storage backend for product data.
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    image_url TEXT NOT NULL,
+    description TEXT NOT NULL,
+    price REAL NOT NULL,
+    currency TEXT NOT NULL DEFAULT 'USD',
+    rating REAL,
+    specifications TEXT NOT NULL DEFAULT '{}',
+    source_url TEXT
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+_COLUMNS = (
+    "id", "name", "image_url", "description", "price",
+    "currency", "rating", "specifications", "source_url"
+)
+
+
+class ProductStore:
+    """
+    Product storage in a SQLite database running in WAL mode.
+
+    Unlike the JSON file, saving only writes the products that changed,
+    readers can query while the scraper writes, and ID lookups use the
+    primary key index instead of loading every product.
+
+    Attributes:
+        db_path: Path to the SQLite database file
+    """
+
+    def __init__(self, db_path: str = "products.db"):
+        """
+        Initialize the store. The database is opened on first use.
+
+        Args:
+            db_path: Path to the SQLite database file (default: products.db)
+        """
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the database, creating the schema if needed.
+
+        Returns:
+            Open connection in autocommit mode
+        """
+        if self._conn is None:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.db_path,
+                isolation_level=None,
+                check_same_thread=False
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection if it's open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def upsert_products(self, products: List[Dict[str, Any]]) -> bool:
+        """
+        Insert or replace products by ID in a single transaction.
+
+        Args:
+            products: Product dictionaries in the stored format
+
+        Returns:
+            True if successful, False otherwise
+        """
+        rows = [
+            (
+                p["id"],
+                p["name"],
+                p["image_url"],
+                p["description"],
+                p["price"],
+                p.get("currency", "USD"),
+                p.get("rating"),
+                json.dumps(p.get("specifications", {}), ensure_ascii=False),
+                p.get("source_url")
+            )
+            for p in products
+        ]
+
+        try:
+            conn = self._connect()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO products ({', '.join(_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                    rows
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('updated_ns', ?)",
+                    (time.time_ns(),)
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+            logger.info("Saved %d products to %s", len(rows), self.db_path)
+            return True
+        except Exception as e:
+            logger.error("Error saving products to %s: %s", self.db_path, e)
+            return False
+
+    def get_products(self) -> List[Dict[str, Any]]:
+        """
+        Load all products ordered by ID.
+
+        Read errors are raised rather than logged, so callers that cache the
+        result (like the API) never mistake a locked database for an empty one.
+
+        Returns:
+            List of product dictionaries
+
+        Raises:
+            sqlite3.Error: If the database can't be read
+
+        Example:
+            >>> store = ProductStore("products.db")
+            >>> store.get_products()
+        """
+        rows = self._connect().execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM products ORDER BY id"
+        ).fetchall()
+
+        products = []
+        for row in rows:
+            product = dict(row)
+            product["specifications"] = json.loads(product["specifications"])
+            products.append(product)
+        return products
+
+    def count(self) -> int:
+        """
+        Count stored products.
+
+        Returns:
+            Number of products in the database
+        """
+        return self._connect().execute("SELECT COUNT(*) FROM products").fetchone()[0]
+
+    def version(self) -> Optional[int]:
+        """
+        Get the time of the last write, usable as a cache key.
+
+        Returns:
+            Nanosecond timestamp of the last upsert, or None if nothing was saved
+        """
+        row = self._connect().execute(
+            "SELECT value FROM meta WHERE key = 'updated_ns'"
+        ).fetchone()
+        return row[0] if row else None